@@ -11,6 +11,34 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from models.user_profile import UserProfile, AccessibilityNeeds
 
+# Vocabulary replacements per level, applied in order; compiled once
+_SIMPLE_PATTERNS = tuple(
+    (re.compile(re.escape(complex_word), re.IGNORECASE), simple_word)
+    for complex_word, simple_word in {
+        "competency": "skill",
+        "framework": "plan",
+        "assessment": "test",
+        "evaluate": "check",
+        "implement": "start using",
+        "cascade": "spread out",
+        "facilitate": "help",
+        "optimize": "make better",
+        "collaborate": "work together",
+        "strategic": "planned",
+        "entrepreneurship": "starting new things",
+        "behavioral indicators": "actions you can see"
+    }.items()
+)
+
+_MODERATE_PATTERNS = tuple(
+    (re.compile(re.escape(complex_phrase), re.IGNORECASE), simpler_phrase)
+    for complex_phrase, simpler_phrase in {
+        "competency framework": "skill plan",
+        "behavioral indicators": "observable actions",
+        "entrepreneurship": "innovation and new ideas"
+    }.items()
+)
+
 
 class AccessibilityAgent:
     """
@@ -91,25 +119,8 @@ class AccessibilityAgent:
         simplified = text
 
         if level == "simple":
-            # Replace complex words with simpler alternatives
-            replacements = {
-                "competency": "skill",
-                "framework": "plan",
-                "assessment": "test",
-                "evaluate": "check",
-                "implement": "start using",
-                "cascade": "spread out",
-                "facilitate": "help",
-                "optimize": "make better",
-                "collaborate": "work together",
-                "strategic": "planned",
-                "entrepreneurship": "starting new things",
-                "behavioral indicators": "actions you can see"
-            }
-
-            for complex_word, simple_word in replacements.items():
-                # Case-insensitive replacement
-                pattern = re.compile(re.escape(complex_word), re.IGNORECASE)
+            # Replace complex words with simpler alternatives (case-insensitive)
+            for pattern, simple_word in _SIMPLE_PATTERNS:
                 simplified = pattern.sub(simple_word, simplified)
 
             # Shorten sentences
@@ -117,14 +128,7 @@ class AccessibilityAgent:
 
         elif level == "moderate":
             # Less aggressive simplification
-            replacements = {
-                "competency framework": "skill plan",
-                "behavioral indicators": "observable actions",
-                "entrepreneurship": "innovation and new ideas"
-            }
-
-            for complex_phrase, simpler_phrase in replacements.items():
-                pattern = re.compile(re.escape(complex_phrase), re.IGNORECASE)
+            for pattern, simpler_phrase in _MODERATE_PATTERNS:
                 simplified = pattern.sub(simpler_phrase, simplified)
 
         return simplified
@@ -1,6 +1,7 @@
 """
 Director Agent - Invisible supervisor that monitors and guides simulation
 """
+import asyncio
 from typing import Optional, Dict, List
 from datetime import datetime, timedelta
 import sys
@@ -67,6 +68,21 @@ class DirectorAgent:
 
         return None  # No intervention needed
 
+    async def amonitor_conversation(
+        self,
+        session_state: SessionState,
+        latest_user_message: str
+    ) -> Optional[Dict]:
+        """
+        Async variant of monitor_conversation
+
+        The embedding work runs in a worker thread so the event loop stays
+        free while it runs.
+        """
+        return await asyncio.to_thread(
+            self.monitor_conversation, session_state, latest_user_message
+        )
+
     def _is_stuck_loop(self, session_state: SessionState, latest_message: str) -> bool:
         """Detect if user is asking similar questions repeatedly"""
         if not self.embedding_model:
@@ -84,16 +100,21 @@ class DirectorAgent:
 
         try:
             # Compute embeddings
-            embeddings = self.embedding_model.encode(recent_messages)
-
-            # Calculate pairwise similarities
-            similarities = []
-            for i in range(len(embeddings) - 1):
-                sim = self._cosine_similarity(embeddings[i], embeddings[-1])
-                similarities.append(sim)
+            embeddings = np.asarray(self.embedding_model.encode(recent_messages), dtype=np.float32)
+
+            # Cosine similarity of each earlier message to the latest one,
+            # as one matrix-vector product (0 where a vector has no norm)
+            norms = np.linalg.norm(embeddings, axis=1)
+            norm_products = norms[:-1] * norms[-1]
+            similarities = np.divide(
+                embeddings[:-1] @ embeddings[-1],
+                norm_products,
+                out=np.zeros_like(norm_products),
+                where=norm_products > 0
+            )
 
             # If all recent messages are very similar, it's a loop
-            avg_similarity = np.mean(similarities)
+            avg_similarity = similarities.mean()
 
             return avg_similarity > SIMILARITY_THRESHOLD
         except Exception as e:
@@ -3,6 +3,7 @@ Knowledge Base with RAG (Retrieval-Augmented Generation)
 """
 import faiss
 import numpy as np
+from collections import OrderedDict
 from typing import List, Dict, Optional
 from sentence_transformers import SentenceTransformer
 from pathlib import Path
@@ -11,7 +12,10 @@ import sys
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from config import KNOWLEDGE_BASE_DIR, EMBEDDING_MODEL, TOP_K_RETRIEVAL
+from config import KNOWLEDGE_BASE_DIR, EMBEDDING_MODEL, EMBEDDING_QUANTIZE, TOP_K_RETRIEVAL
+
+# Maximum number of query embeddings kept in memory
+EMBEDDING_CACHE_SIZE = 4096
 
 
 class KnowledgeBase:
@@ -40,6 +44,9 @@ class KnowledgeBase:
             print(f"⚠️  Could not load embedding model: {e}")
             self.embedding_model = None
 
+        if self.embedding_model and EMBEDDING_QUANTIZE:
+            self._quantize_embedding_model()
+
         # Storage
         self.documents: List[Dict] = []
         self.embeddings: Optional[np.ndarray] = None
@@ -47,6 +54,22 @@ class KnowledgeBase:
 
         # Cache
         self.query_cache: Dict[str, List[Dict]] = {}
+        self.embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+    def _quantize_embedding_model(self):
+        """Swap the embedding model's Linear layers for dynamic int8 ones"""
+        try:
+            import torch
+
+            torch.quantization.quantize_dynamic(
+                self.embedding_model,
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+                inplace=True
+            )
+            print("✅ Embedding model quantized to int8")
+        except Exception as e:
+            print(f"⚠️  Could not quantize embedding model: {e}")
 
     def load_documents(self):
         """Load and index all knowledge base documents"""
@@ -169,52 +192,120 @@ class KnowledgeBase:
         Returns:
             List of relevant document chunks with scores
         """
-        # Check cache
-        cache_key = f"{query}_{top_k}_{filter_metadata}"
-        if cache_key in self.query_cache:
-            return self.query_cache[cache_key]
+        return self.search_many([query], top_k=top_k, filter_metadata=filter_metadata)[0]
 
-        if not self.index or not self.documents or not self.embedding_model:
-            return []
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = TOP_K_RETRIEVAL,
+        filter_metadata: Optional[Dict] = None
+    ) -> List[List[Dict]]:
+        """
+        Search knowledge base for several queries at once
+
+        Uncached queries are embedded in a single model call and looked up
+        with a single FAISS search.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            One list of relevant document chunks per query, in order
+        """
+        results: List[List[Dict]] = [[] for _ in queries]
+
+        # Check cache
+        pending = []
+        for i, query in enumerate(queries):
+            cache_key = f"{query}_{top_k}_{filter_metadata}"
+            if cache_key in self.query_cache:
+                results[i] = self.query_cache[cache_key]
+            else:
+                pending.append((i, query, cache_key))
+
+        if not pending or not self.index or not self.documents or not self.embedding_model:
+            return results
 
         try:
-            # Encode query
-            query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)
+            # Encode queries
+            query_embeddings = self._encode_queries([query for _, query, _ in pending])
 
             # Search FAISS index
             distances, indices = self.index.search(
-                query_embedding.astype('float32'),
+                query_embeddings,
                 min(top_k * 2, len(self.documents))  # Get more, then filter
             )
 
-            # Retrieve documents
-            results = []
-            for dist, idx in zip(distances[0], indices[0]):
-                if idx < len(self.documents):
-                    doc = self.documents[int(idx)]
-
-                    # Apply metadata filter if provided
-                    if filter_metadata:
-                        if not all(doc["metadata"].get(k) == v for k, v in filter_metadata.items()):
-                            continue
-
-                    results.append({
-                        "content": doc["content"],
-                        "metadata": doc["metadata"],
-                        "score": float(dist),
-                        "chunk_id": doc["id"]
-                    })
-
-                    if len(results) >= top_k:
-                        break
+            for (i, _, cache_key), row_distances, row_indices in zip(pending, distances, indices):
+                results[i] = self._collect_results(row_distances, row_indices, top_k, filter_metadata)
 
-            # Cache results
-            self.query_cache[cache_key] = results
+                # Cache results
+                self.query_cache[cache_key] = results[i]
 
             return results
         except Exception as e:
             print(f"⚠️  Search error: {e}")
-            return []
+            return results
+
+    def _encode_queries(self, queries: List[str]) -> np.ndarray:
+        """Embed queries, reusing cached embeddings and batching the rest"""
+        # Collect every row before inserting new embeddings: the LRU
+        # eviction below may drop entries this batch still needs
+        embeddings = {}
+        for query in dict.fromkeys(queries):
+            embedding = self.embedding_cache.get(query)
+            if embedding is not None:
+                self.embedding_cache.move_to_end(query)
+                embeddings[query] = embedding
+
+        missing = [q for q in dict.fromkeys(queries) if q not in embeddings]
+
+        if missing:
+            encoded = self.embedding_model.encode(
+                missing,
+                batch_size=len(missing),
+                convert_to_numpy=True
+            ).astype('float32')
+
+            for query, embedding in zip(missing, encoded):
+                embeddings[query] = embedding
+                self.embedding_cache[query] = embedding
+                if len(self.embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    self.embedding_cache.popitem(last=False)
+
+        return np.stack([embeddings[query] for query in queries])
+
+    def _collect_results(
+        self,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        top_k: int,
+        filter_metadata: Optional[Dict]
+    ) -> List[Dict]:
+        """Turn one row of FAISS hits into filtered result dicts"""
+        results = []
+        for dist, idx in zip(distances, indices):
+            if idx < len(self.documents):
+                doc = self.documents[int(idx)]
+
+                # Apply metadata filter if provided
+                if filter_metadata:
+                    if not all(doc["metadata"].get(k) == v for k, v in filter_metadata.items()):
+                        continue
+
+                results.append({
+                    "content": doc["content"],
+                    "metadata": doc["metadata"],
+                    "score": float(dist),
+                    "chunk_id": doc["id"]
+                })
+
+                if len(results) >= top_k:
+                    break
+
+        return results
 
     def get_context_for_npc(
         self,
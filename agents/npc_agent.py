@@ -2,6 +2,9 @@
 NPC Agent - The core AI co-worker engine
 """
 import anthropic
+import httpx
+import re
+from functools import cache
 from typing import Dict, Tuple, Optional, List
 from datetime import datetime
 import sys
@@ -14,6 +17,50 @@ from models.state import SessionState, Message, RelationshipState
 from models.personas import PERSONA_REGISTRY, PersonaConfig
 from config import ANTHROPIC_API_KEY, LLM_MODEL, LLM_TEMPERATURE, LLM_MAX_TOKENS
 
+# Try to import h2 so concurrent async LLM calls can share HTTP/2 connections
+try:
+    import h2
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Jailbreak phrases, matched in one scan over the lowercased message
+_JAILBREAK_PATTERNS = (
+    "ignore previous instructions",
+    "ignore all previous",
+    "you are now",
+    "forget your role",
+    "disregard your",
+    "new instructions:",
+    "system:",
+    "override"
+)
+_JAILBREAK_RE = re.compile("|".join(map(re.escape, _JAILBREAK_PATTERNS)))
+
+
+@cache
+def _get_clients(api_key: str) -> Tuple[anthropic.Anthropic, anthropic.AsyncAnthropic]:
+    """
+    Shared Anthropic clients per API key
+
+    NPCAgent is built per request; reusing the clients keeps their HTTP
+    connection pools (and TLS sessions) alive instead of rebuilding them.
+    """
+    http_client = None
+    if HTTP2_AVAILABLE and hasattr(anthropic, "DefaultAsyncHttpxClient"):
+        # Multiplex concurrent requests (e.g. asyncio.gather'd NPC turns)
+        # over a few keep-alive HTTP/2 connections
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+
+    return (
+        anthropic.Anthropic(api_key=api_key),
+        anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
+    )
+
 
 class NPCAgent:
     """
@@ -45,8 +92,9 @@ class NPCAgent:
         if not api_key or api_key.startswith("your_"):
             print(f"⚠️  Warning: ANTHROPIC_API_KEY not set. Using mock responses.")
             self.client = None
+            self.async_client = None
         else:
-            self.client = anthropic.Anthropic(api_key=api_key)
+            self.client, self.async_client = _get_clients(api_key)
 
     def process_message(
         self,
@@ -77,11 +125,48 @@ class NPCAgent:
         # 3. Call LLM
         response_text = self._call_llm(system_prompt, messages)
 
-        # 4. Analyze sentiment & update relationship
+        # 4-5. Update relationship & session state
+        session_state = self._record_turn(session_state, user_message, response_text)
+
+        return response_text, session_state, safety_flags
+
+    async def aprocess_message(
+        self,
+        user_message: str,
+        session_state: SessionState
+    ) -> Tuple[str, SessionState, List[str]]:
+        """
+        Async variant of process_message
+
+        The LLM call is awaited instead of blocking, so several NPC turns
+        can overlap their API latency (e.g. via asyncio.gather).
+        """
+        safety_flags = self._safety_check(user_message)
+        if "jailbreak" in safety_flags or "profanity" in safety_flags:
+            response = self._generate_safety_response(safety_flags)
+            return response, session_state, safety_flags
+
+        system_prompt = self._build_system_prompt(session_state)
+        messages = self._build_message_history(session_state, user_message)
+
+        response_text = await self._acall_llm(system_prompt, messages)
+
+        session_state = self._record_turn(session_state, user_message, response_text)
+
+        return response_text, session_state, safety_flags
+
+    def _record_turn(
+        self,
+        session_state: SessionState,
+        user_message: str,
+        response_text: str
+    ) -> SessionState:
+        """Update relationship and conversation history after a turn"""
+        # Analyze sentiment & update relationship
         sentiment = self._analyze_sentiment(response_text)
         session_state = self._update_relationship(session_state, sentiment)
 
-        # 5. Update session state
+        # Update session state
         user_msg = Message(
             role="user",
             content=user_message,
@@ -98,7 +183,7 @@ class NPCAgent:
         session_state.add_message(assistant_msg)
         session_state.active_npc = self.persona_id
 
-        return response_text, session_state, safety_flags
+        return session_state
 
     def _build_system_prompt(self, session_state: SessionState) -> str:
         """Build dynamic system prompt with context"""
@@ -175,6 +260,27 @@ class NPCAgent:
             print(f"❌ LLM API Error: {e}")
             return self._generate_fallback_response()
 
+    async def _acall_llm(self, system_prompt: str, messages: List[Dict]) -> str:
+        """Call Anthropic Claude API without blocking the event loop"""
+        if not self.async_client:
+            # Mock response if no API key
+            return self._generate_mock_response(messages[-1]["content"])
+
+        try:
+            response = await self.async_client.messages.create(
+                model=LLM_MODEL,
+                max_tokens=LLM_MAX_TOKENS,
+                temperature=LLM_TEMPERATURE,
+                system=system_prompt,
+                messages=messages
+            )
+
+            return response.content[0].text
+
+        except Exception as e:
+            print(f"❌ LLM API Error: {e}")
+            return self._generate_fallback_response()
+
     def _generate_mock_response(self, user_message: str) -> str:
         """Generate mock response when API key not available"""
         return f"[MOCK RESPONSE from {self.persona.name}] I understand you're asking about: '{user_message[:50]}...'. This is a mock response because ANTHROPIC_API_KEY is not configured. Please add your API key to .env file to get real AI responses."
@@ -188,22 +294,8 @@ class NPCAgent:
             flags.append("too_long")
 
         # Check for jailbreak attempts
-        jailbreak_patterns = [
-            "ignore previous instructions",
-            "ignore all previous",
-            "you are now",
-            "forget your role",
-            "disregard your",
-            "new instructions:",
-            "system:",
-            "override"
-        ]
-
-        user_lower = user_message.lower()
-        for pattern in jailbreak_patterns:
-            if pattern in user_lower:
-                flags.append("jailbreak")
-                break
+        if _JAILBREAK_RE.search(user_message.lower()):
+            flags.append("jailbreak")
 
         return flags
 
@@ -195,7 +195,7 @@ async def chat_with_npc(
             raise HTTPException(status_code=404, detail="Session not found")
 
         # Sanitize user input
-        user_message = security_service.sanitize_user_input(user_message)
+        user_message = security_service.sanitize_for_llm(user_message)
 
         # Check rate limit
         if not security_service.check_rate_limit(session.user_id, "chat"):
@@ -83,7 +83,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                 continue
 
             # Sanitize input
-            user_message = security_service.sanitize_user_input(user_message)
+            user_message = security_service.sanitize_for_llm(user_message)
 
             # Check rate limit
             if not security_service.check_rate_limit(session.user_id, "chat"):
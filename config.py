@@ -30,6 +30,8 @@ LLM_MAX_TOKENS = 2000
 VECTOR_DB_PATH = str(BASE_DIR / "vector_store")
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 TOP_K_RETRIEVAL = 3
+# Quantize the embedding model's Linear layers to int8 (CPU inference)
+EMBEDDING_QUANTIZE = os.getenv("EMBEDDING_QUANTIZE", "false").lower() == "true"
 
 # Session Settings
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
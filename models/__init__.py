@@ -17,6 +17,7 @@ from .personas import (
 from .user_profile import (
     AccessibilityNeeds,
     AgeGroup,
+    AGE_GROUPS,
     UserProfile
 )
 
@@ -37,5 +38,6 @@ __all__ = [
     # User profile models
     "AccessibilityNeeds",
     "AgeGroup",
+    "AGE_GROUPS",
     "UserProfile",
 ]
\ No newline at end of file
@@ -5,6 +5,10 @@ from typing import List, Dict, Optional, Literal
 from pydantic import BaseModel, Field
 from datetime import datetime
 
+# Messages kept per session; older turns are dropped so long sessions
+# don't grow memory (and Redis payloads) without bound
+MAX_CONVERSATION_HISTORY = 256
+
 
 class Message(BaseModel):
     """Single message in conversation"""
@@ -59,12 +63,18 @@ class SessionState(BaseModel):
     def add_message(self, message: Message):
         """Add message and update state"""
         self.conversation_history.append(message)
+        if len(self.conversation_history) > MAX_CONVERSATION_HISTORY:
+            del self.conversation_history[:-MAX_CONVERSATION_HISTORY]
         self.updated_at = datetime.now()
         
         # Update relationship if NPC message
         if message.npc_id and message.npc_id in self.relationships:
             self.relationships[message.npc_id].interaction_count += 1
     
+    def clone(self) -> "SessionState":
+        """Independent deep copy (a dump/validate round-trip, much faster than deepcopy)"""
+        return SessionState.model_validate(self.model_dump())
+    
     def get_recent_history(self, n: int = 10) -> List[Message]:
         """Get last N messages"""
         return self.conversation_history[-n:]
@@ -1,8 +1,8 @@
 """
 User Profile with Accessibility and Age Adaptation
 """
-from typing import Optional, Literal
-from pydantic import BaseModel, Field
+from typing import Dict, Optional, Literal
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -38,7 +38,14 @@ class AccessibilityNeeds(BaseModel):
 
 
 class AgeGroup(BaseModel):
-    """Age-appropriate content adaptation"""
+    """
+    Age-appropriate content adaptation
+
+    Instances are immutable; use AgeGroup.get() for the shared preset of an
+    age range instead of building (and validating) a new one each time.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     age_range: Literal["8-12", "13-15", "16-18", "19-25", "26+"] = "26+"
 
@@ -55,6 +62,53 @@ class AgeGroup(BaseModel):
     encouragement_level: Literal["minimal", "moderate", "high"] = "minimal"
     explanation_depth: Literal["brief", "standard", "detailed"] = "standard"
 
+    @classmethod
+    def get(cls, age_range: str) -> "AgeGroup":
+        """
+        Get the shared preset for an age range
+
+        Args:
+            age_range: One of "8-12", "13-15", "16-18", "19-25", "26+"
+
+        Returns:
+            Frozen AgeGroup singleton
+        """
+        return AGE_GROUPS[age_range]
+
+
+# Presets per age range, built once at import
+AGE_GROUPS: Dict[str, AgeGroup] = {
+    "8-12": AgeGroup(
+        age_range="8-12",
+        reading_level="elementary",
+        vocabulary_complexity="simple",
+        sensitive_content_filter=True,
+        gamification_enabled=True,
+        encouragement_level="high",
+        explanation_depth="detailed"
+    ),
+    "13-15": AgeGroup(
+        age_range="13-15",
+        reading_level="middle",
+        vocabulary_complexity="moderate",
+        sensitive_content_filter=True,
+        gamification_enabled=True,
+        encouragement_level="moderate"
+    ),
+    "16-18": AgeGroup(
+        age_range="16-18",
+        reading_level="high",
+        vocabulary_complexity="moderate",
+        encouragement_level="moderate"
+    ),
+    "19-25": AgeGroup(
+        age_range="19-25",
+        reading_level="college",
+        vocabulary_complexity="advanced"
+    ),
+    "26+": AgeGroup(),
+}
+
 
 class UserProfile(BaseModel):
     """Complete user profile for personalization"""
@@ -65,7 +119,7 @@ class UserProfile(BaseModel):
 
     # Demographics (optional, for adaptation)
     age: Optional[int] = None
-    age_group: AgeGroup = Field(default_factory=AgeGroup)
+    age_group: AgeGroup = Field(default_factory=lambda: AGE_GROUPS["26+"])
 
     # Accessibility
     accessibility: AccessibilityNeeds = Field(default_factory=AccessibilityNeeds)
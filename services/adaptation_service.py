@@ -5,6 +5,7 @@ from typing import Dict, Optional
 import sys
 from pathlib import Path
 import random
+import textwrap
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -25,10 +26,32 @@ class AdaptationService:
     - 26+: Experienced professionals
     """
 
+    # Persona variant key for each age bucket (see _age_bucket)
+    _PERSONA_KEYS = ("child", "teen", "young_adult", "college", "adult")
+
+    # Share of responses that get encouragement, per encouragement level
+    _ENCOURAGEMENT_FREQUENCY = {"high": 1.0, "moderate": 0.3}
+
     def __init__(self):
         self.accessibility_agent = AccessibilityAgent()
         self.age_personas = self._load_age_adapted_personas()
 
+        # Content adapter for each age bucket (see _age_bucket)
+        self._age_adapters = (
+            self._adapt_for_children,
+            self._adapt_for_teens,
+            self._adapt_for_young_adults,
+            self._adapt_for_college_age,
+            lambda text: text,  # Full professional content, no adaptation
+        )
+
+    @staticmethod
+    def _age_bucket(age: Optional[int]) -> int:
+        """Map age to bucket index: 0=8-12, 1=13-15, 2=16-18, 3=19-25, 4=26+"""
+        if not age:
+            return 4
+        return 0 if age < 13 else 1 if age < 16 else 2 if age < 19 else 3 if age < 26 else 4
+
     def adapt_npc_response(
         self,
         npc_id: str,
@@ -51,34 +74,20 @@ class AdaptationService:
         )
 
         # 3. Add age-appropriate encouragement
-        if user_profile.age_group.encouragement_level == "high":
+        age_group = user_profile.age_group
+        frequency = self._ENCOURAGEMENT_FREQUENCY.get(age_group.encouragement_level)
+        if frequency:
             adapted_result["text"] = self._add_encouragement(
                 adapted_result["text"],
-                user_profile.age_group.age_range
-            )
-        elif user_profile.age_group.encouragement_level == "moderate":
-            adapted_result["text"] = self._add_encouragement(
-                adapted_result["text"],
-                user_profile.age_group.age_range,
-                frequency=0.3  # 30% of time
+                age_group.age_range,
+                frequency=frequency
             )
 
         return adapted_result
 
     def _adapt_for_age(self, text: str, user_profile: UserProfile) -> str:
         """Adapt content for specific age groups"""
-        age = user_profile.age
-
-        if age and age < 13:  # 8-12 years old
-            return self._adapt_for_children(text)
-        elif age and age < 16:  # 13-15 years old
-            return self._adapt_for_teens(text)
-        elif age and age < 19:  # 16-18 years old
-            return self._adapt_for_young_adults(text)
-        elif age and age < 26:  # 19-25 years old
-            return self._adapt_for_college_age(text)
-        else:  # 26+ years old
-            return text  # Full professional content, no adaptation
+        return self._age_adapters[self._age_bucket(user_profile.age)](text)
 
     def _adapt_for_children(self, text: str) -> str:
         """Adapt for 8-12 year olds"""
@@ -131,8 +140,12 @@ class AdaptationService:
         }
 
         for term, explanation in career_context.items():
-            if term in adapted and explanation not in adapted:
-                adapted = adapted.replace(term, explanation, 1)
+            if explanation in adapted:
+                continue
+            # Single scan: split around the first occurrence and splice in
+            before, found, after = adapted.partition(term)
+            if found:
+                adapted = before + explanation + after
 
         # Add subtle career framing
         if "leadership development" in adapted and "career" not in adapted:
@@ -217,130 +230,139 @@ class AdaptationService:
         user_profile: UserProfile
     ) -> str:
         """Get age-adapted persona system prompt"""
-        base_prompt = self.age_personas.get(npc_id, {}).get("adult", "")
-
-        if user_profile.age and user_profile.age < 13:
-            return self.age_personas.get(npc_id, {}).get("child", base_prompt)
-        elif user_profile.age and user_profile.age < 16:
-            return self.age_personas.get(npc_id, {}).get("teen", base_prompt)
-        elif user_profile.age and user_profile.age < 19:
-            return self.age_personas.get(npc_id, {}).get("young_adult", base_prompt)
-        elif user_profile.age and user_profile.age < 26:
-            return self.age_personas.get(npc_id, {}).get("college", base_prompt)
-        else:
-            return base_prompt
+        personas = self.age_personas.get(npc_id, {})
+        base_prompt = personas.get("adult", "")
+
+        persona_key = self._PERSONA_KEYS[self._age_bucket(user_profile.age)]
+        return personas.get(persona_key, base_prompt)
 
     def _load_age_adapted_personas(self) -> Dict:
         """Load age-adapted persona prompts"""
-        return {
-            "chro": {
-                "child": """
-                You are Ms. Elena, a friendly HR helper at Gucci Group. 
-                You help people learn about jobs and teamwork.
-                
-                Talk like you're explaining to a 10-year-old:
-                - Use simple words
-                - Give examples from school or sports teams
-                - Be encouraging and patient
-                - Ask fun questions to make them think
-                
-                Example: Instead of "competency framework", say "a list of skills people need"
-                Instead of "360-degree feedback", say "asking everyone you work with what you do well"
-                """,
-
-                "teen": """
-                You are Dr. Elena Marchetti, HR Director at Gucci Group.
-                You're helping students learn about professional development.
-                
-                Talk like you're mentoring a high schooler:
-                - Use clear language but not childish
-                - Connect to their experiences (school projects, club leadership)
-                - Explain business terms when you use them
-                - Be supportive but treat them seriously
-                """,
-
-                "young_adult": """
-                You are Dr. Elena Marchetti, CHRO at Gucci Group.
-                You're mentoring a high school student about career development.
-                
-                Talk professionally but add context:
-                - Explain business concepts clearly
-                - Use examples from internships or first jobs
-                - Treat them seriously as emerging professionals
-                """,
-
-                "college": """
-                You are Dr. Elena Marchetti, CHRO at Gucci Group.
-                You're coaching a college student or early-career professional (19-25 years old).
-                
-                Professional tone with career development focus:
-                - Use full business vocabulary but explain luxury industry jargon
-                - Relate concepts to: internships, entry-level roles, career decisions, rotational programs
-                - Frame everything as career-building: "This skill will serve you throughout your career"
-                - Examples: "Similar to when you're choosing between job offers..." or "Like in a management training program..."
-                - Be encouraging about growth trajectory
-                - Share how these frameworks help with career advancement
-                
-                Career context examples:
-                - "Inter-brand mobility is like rotational programs at companies like GE or P&G"
-                - "360-degree feedback is common for high-potential early-career professionals"
-                - "This competency framework helps you understand what Senior Director level requires"
-                """,
-
-                "adult": "[Full professional CHRO persona from personas.py]"
-            },
-
-            "ceo": {
-                "child": """
-                You are Mr. Alessandro, the CEO of Gucci Group.
-                You help kids understand how companies work.
-                
-                Talk like you're explaining business to a young team captain:
-                - Use simple words about teams, goals, and winning
-                - Give examples from sports or school
-                - Be inspiring but clear
-                """,
-
-                "college": """
-                You are Alessandro Ricci, CEO of Gucci Group.
-                You're speaking with a young professional (19-25 years old).
-                
-                Professional and strategic, but accessible:
-                - Use business school case study style
-                - Explain strategic concepts clearly with career implications
-                - Challenge them to think like future executives
-                - Frame decisions as: "In your future leadership career, you'll face similar trade-offs"
-                - Relate to business school concepts or management training
-                
-                Examples:
-                - "Think about this like a case study on organizational design"
-                - "When you're a VP someday, you'll balance brand autonomy vs. efficiency"
-                """,
-
-                "adult": "[Full professional CEO persona]"
-            },
-
-            "regional_manager": {
-                "college": """
-                You are Marie Dubois, Regional Manager at Gucci Group.
-                You're mentoring an early-career HR professional (19-25 years old).
-                
-                Practical and relatable - like a friendly mentor:
-                - Share real-world implementation challenges
-                - Use examples from your early career: "When I was starting out..."
-                - Focus on practical skills vs pure theory
-                - Help them understand the gap between classroom learning and real-world execution
-                - Encourage them about learning from experience
-                
-                Examples:
-                - "In your first HR role, you'll face similar resource constraints"
-                - "When I was an HR coordinator, I learned that change management is 80% people, 20% process"
-                - "This is great preparation for when you're managing regional rollouts"
-                """,
-
-                "adult": "[Full professional Regional Manager persona]"
-            }
-        }
+        # Copies of the shared (pre-dedented) table, so edits on one
+        # instance don't reach the others
+        return {npc_id: dict(variants) for npc_id, variants in _AGE_PERSONAS.items()}
+
+
+# Age-adapted persona prompts, keyed by NPC then age variant
+_RAW_AGE_PERSONAS: Dict[str, Dict[str, str]] = {
+    "chro": {
+        "child": """
+        You are Ms. Elena, a friendly HR helper at Gucci Group. 
+        You help people learn about jobs and teamwork.
+        
+        Talk like you're explaining to a 10-year-old:
+        - Use simple words
+        - Give examples from school or sports teams
+        - Be encouraging and patient
+        - Ask fun questions to make them think
+        
+        Example: Instead of "competency framework", say "a list of skills people need"
+        Instead of "360-degree feedback", say "asking everyone you work with what you do well"
+        """,
+
+        "teen": """
+        You are Dr. Elena Marchetti, HR Director at Gucci Group.
+        You're helping students learn about professional development.
+        
+        Talk like you're mentoring a high schooler:
+        - Use clear language but not childish
+        - Connect to their experiences (school projects, club leadership)
+        - Explain business terms when you use them
+        - Be supportive but treat them seriously
+        """,
+
+        "young_adult": """
+        You are Dr. Elena Marchetti, CHRO at Gucci Group.
+        You're mentoring a high school student about career development.
+        
+        Talk professionally but add context:
+        - Explain business concepts clearly
+        - Use examples from internships or first jobs
+        - Treat them seriously as emerging professionals
+        """,
+
+        "college": """
+        You are Dr. Elena Marchetti, CHRO at Gucci Group.
+        You're coaching a college student or early-career professional (19-25 years old).
+        
+        Professional tone with career development focus:
+        - Use full business vocabulary but explain luxury industry jargon
+        - Relate concepts to: internships, entry-level roles, career decisions, rotational programs
+        - Frame everything as career-building: "This skill will serve you throughout your career"
+        - Examples: "Similar to when you're choosing between job offers..." or "Like in a management training program..."
+        - Be encouraging about growth trajectory
+        - Share how these frameworks help with career advancement
+        
+        Career context examples:
+        - "Inter-brand mobility is like rotational programs at companies like GE or P&G"
+        - "360-degree feedback is common for high-potential early-career professionals"
+        - "This competency framework helps you understand what Senior Director level requires"
+        """,
+
+        "adult": "[Full professional CHRO persona from personas.py]"
+    },
+
+    "ceo": {
+        "child": """
+        You are Mr. Alessandro, the CEO of Gucci Group.
+        You help kids understand how companies work.
+        
+        Talk like you're explaining business to a young team captain:
+        - Use simple words about teams, goals, and winning
+        - Give examples from sports or school
+        - Be inspiring but clear
+        """,
+
+        "college": """
+        You are Alessandro Ricci, CEO of Gucci Group.
+        You're speaking with a young professional (19-25 years old).
+        
+        Professional and strategic, but accessible:
+        - Use business school case study style
+        - Explain strategic concepts clearly with career implications
+        - Challenge them to think like future executives
+        - Frame decisions as: "In your future leadership career, you'll face similar trade-offs"
+        - Relate to business school concepts or management training
+        
+        Examples:
+        - "Think about this like a case study on organizational design"
+        - "When you're a VP someday, you'll balance brand autonomy vs. efficiency"
+        """,
+
+        "adult": "[Full professional CEO persona]"
+    },
+
+    "regional_manager": {
+        "college": """
+        You are Marie Dubois, Regional Manager at Gucci Group.
+        You're mentoring an early-career HR professional (19-25 years old).
+        
+        Practical and relatable - like a friendly mentor:
+        - Share real-world implementation challenges
+        - Use examples from your early career: "When I was starting out..."
+        - Focus on practical skills vs pure theory
+        - Help them understand the gap between classroom learning and real-world execution
+        - Encourage them about learning from experience
+        
+        Examples:
+        - "In your first HR role, you'll face similar resource constraints"
+        - "When I was an HR coordinator, I learned that change management is 80% people, 20% process"
+        - "This is great preparation for when you're managing regional rollouts"
+        """,
+
+        "adult": "[Full professional Regional Manager persona]"
+    }
+}
+
+# Prompts are dedented once at import (indentation is wasted LLM tokens)
+# and shared by every AdaptationService instance
+_AGE_PERSONAS: Dict[str, Dict[str, str]] = {
+    npc_id: {
+        variant: sys.intern(textwrap.dedent(prompt).strip())
+        for variant, prompt in variants.items()
+    }
+    for npc_id, variants in _RAW_AGE_PERSONAS.items()
+}
 
 
 # Global adaptation service
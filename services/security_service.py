@@ -1,10 +1,14 @@
 """
 Security Service - Encryption, authentication, data protection
 """
+import base64
 import hashlib
+import os
 import secrets
 import re
-from typing import Optional, Dict
+import time
+from functools import cached_property
+from typing import Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
@@ -12,25 +16,31 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES, MAX_MESSAGE_LENGTH
 
-# Import JWT
-try:
-    import jwt
-    JWT_AVAILABLE = True
-except ImportError:
-    JWT_AVAILABLE = False
-    print("⚠️  PyJWT not installed. Token auth disabled.")
+from pydantic import BaseModel
 
-# Import cryptography
+# Try to import orjson for the JWT claims segment
 try:
-    from cryptography.fernet import Fernet
-    CRYPTO_AVAILABLE = True
+    import orjson
+
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CRYPTO_AVAILABLE = False
-    print("⚠️  cryptography not installed. Encryption disabled.")
+    ORJSON_AVAILABLE = False
 
-from pydantic import BaseModel
+# Script blocks, SQL statements and SQL comment markers, removed in one pass.
+# SQL keywords only match together with their statement partner, so plain
+# prose such as "Please SELECT the best candidate" is left untouched.
+_INJECTION_RE = re.compile(
+    r"<script[^>]*>.*?</script>"
+    r"|\b(?:DROP\s+TABLE|DELETE\s+FROM|INSERT\s+INTO|UPDATE\s+\w+\s+SET"
+    r"|SELECT\s+(?:\*|\w+(?:\s*,\s*\w+)*)\s+FROM)\b"
+    r"|--",
+    re.DOTALL | re.IGNORECASE
+)
+
+# Rate limiting window, in time.monotonic_ns() units
+_NS_PER_MINUTE = 60_000_000_000
 
 
 class SecurityConfig:
@@ -38,7 +48,7 @@ class SecurityConfig:
     SECRET_KEY = SECRET_KEY
     ALGORITHM = ALGORITHM
     ACCESS_TOKEN_EXPIRE_MINUTES = ACCESS_TOKEN_EXPIRE_MINUTES
-    ENCRYPTION_KEY = Fernet.generate_key() if CRYPTO_AVAILABLE else b""
+    ENCRYPTION_KEY = b""  # Generated on first use (see SecurityService.cipher)
 
     # Rate limiting
     MAX_REQUESTS_PER_MINUTE = 60
@@ -64,14 +74,40 @@ class SecurityService:
     def __init__(self):
         self.config = SecurityConfig()
 
-        # Initialize cipher if crypto available
-        if CRYPTO_AVAILABLE:
-            self.cipher = Fernet(self.config.ENCRYPTION_KEY)
-        else:
-            self.cipher = None
-
         # Rate limiting storage (in production: use Redis)
-        self.rate_limit_store: Dict[str, list] = {}
+        self.rate_limit_store: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+    # PyJWT and cryptography are imported on first use so that processes
+    # which never mint tokens or encrypt data skip their import cost
+
+    @cached_property
+    def _jwt(self):
+        """PyJWT module, or None if not installed"""
+        try:
+            import jwt
+        except ImportError:
+            print("⚠️  PyJWT not installed. Token auth disabled.")
+            return None
+        return jwt
+
+    @cached_property
+    def cipher(self):
+        """AES-GCM cipher, or None if cryptography is not installed"""
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+        except ImportError:
+            print("⚠️  cryptography not installed. Encryption disabled.")
+            return None
+
+        if not SecurityConfig.ENCRYPTION_KEY:
+            SecurityConfig.ENCRYPTION_KEY = AESGCM.generate_key(bit_length=128)
+
+        return AESGCM(SecurityConfig.ENCRYPTION_KEY)
+
+    @property
+    def jwt_available(self) -> bool:
+        """Whether PyJWT token auth is available"""
+        return self._jwt is not None
 
     def create_access_token(
         self,
@@ -80,7 +116,8 @@ class SecurityService:
         expires_delta: Optional[timedelta] = None
     ) -> str:
         """Create JWT access token"""
-        if not JWT_AVAILABLE:
+        jwt = self._jwt
+        if jwt is None:
             # Return simple token if JWT not available
             return f"{user_id}:{session_id}:{secrets.token_urlsafe(16)}"
 
@@ -97,6 +134,14 @@ class SecurityService:
             "exp": expire.timestamp()
         }
 
+        if ORJSON_AVAILABLE:
+            # Sign the orjson-encoded claims directly with the JWS layer
+            return jwt.api_jws.encode(
+                orjson.dumps(to_encode),
+                self.config.SECRET_KEY,
+                algorithm=self.config.ALGORITHM
+            )
+
         encoded_jwt = jwt.encode(
             to_encode,
             self.config.SECRET_KEY,
@@ -105,9 +150,41 @@ class SecurityService:
 
         return encoded_jwt
 
+    def _decode_claims(self, jwt, token: str) -> dict:
+        """Verify the token signature and return its claims"""
+        if not ORJSON_AVAILABLE:
+            return jwt.decode(
+                token,
+                self.config.SECRET_KEY,
+                algorithms=[self.config.ALGORITHM]
+            )
+
+        signed = jwt.api_jws.decode_complete(
+            token,
+            self.config.SECRET_KEY,
+            algorithms=[self.config.ALGORITHM]
+        )
+        try:
+            payload = orjson.loads(signed["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload: {e}") from e
+
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload: not a JSON object")
+
+        # jwt.decode checks expiry for us; the JWS layer does not
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            raise jwt.DecodeError("Invalid payload: missing exp claim")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+
+        return payload
+
     def verify_token(self, token: str) -> Optional[TokenData]:
         """Verify and decode JWT token"""
-        if not JWT_AVAILABLE:
+        jwt = self._jwt
+        if jwt is None:
             # Simple token verification
             parts = token.split(":")
             if len(parts) >= 3:
@@ -119,11 +196,7 @@ class SecurityService:
             return None
 
         try:
-            payload = jwt.decode(
-                token,
-                self.config.SECRET_KEY,
-                algorithms=[self.config.ALGORITHM]
-            )
+            payload = self._decode_claims(jwt, token)
 
             return TokenData(
                 user_id=payload.get("user_id"),
@@ -133,7 +206,7 @@ class SecurityService:
         except jwt.ExpiredSignatureError:
             print("Token expired")
             return None
-        except jwt.JWTError as e:
+        except jwt.InvalidTokenError as e:
             print(f"Invalid token: {e}")
             return None
 
@@ -142,15 +215,18 @@ class SecurityService:
         if not self.cipher:
             return data  # Return unencrypted if crypto not available
 
-        encrypted = self.cipher.encrypt(data.encode())
-        return encrypted.decode()
+        # AES-GCM (AES-NI + CLMUL accelerated); fresh 96-bit nonce per message
+        nonce = os.urandom(12)
+        encrypted = self.cipher.encrypt(nonce, data.encode(), None)
+        return base64.urlsafe_b64encode(nonce + encrypted).decode()
 
     def decrypt_sensitive_data(self, encrypted_data: str) -> str:
         """Decrypt sensitive data"""
         if not self.cipher:
             return encrypted_data  # Return as-is if crypto not available
 
-        decrypted = self.cipher.decrypt(encrypted_data.encode())
+        raw = base64.urlsafe_b64decode(encrypted_data.encode())
+        decrypted = self.cipher.decrypt(raw[:12], raw[12:], None)
         return decrypted.decode()
 
     def hash_user_id(self, user_id: str) -> str:
@@ -172,48 +248,50 @@ class SecurityService:
         if limit_per_minute is None:
             limit_per_minute = self.config.MAX_REQUESTS_PER_MINUTE
 
-        key = f"{user_id}_{endpoint}"
-        now = datetime.utcnow()
-
-        # Initialize if new user
-        if key not in self.rate_limit_store:
-            self.rate_limit_store[key] = []
-
-        # Clean old requests (older than 1 minute)
-        self.rate_limit_store[key] = [
-            req_time for req_time in self.rate_limit_store[key]
-            if now - req_time < timedelta(minutes=1)
-        ]
+        # Token bucket: up to limit_per_minute requests in a burst, refilled
+        # at limit_per_minute tokens per minute, in integer nanoseconds
+        key = (user_id, endpoint)
+        now = time.monotonic_ns()
+        last, tokens = self.rate_limit_store.get(key, (now, limit_per_minute))
 
-        # Check limit
-        if len(self.rate_limit_store[key]) >= limit_per_minute:
-            return False
+        refill = (now - last) * limit_per_minute // _NS_PER_MINUTE
+        if tokens + refill >= limit_per_minute:
+            tokens, last = limit_per_minute, now
+        else:
+            # Only advance the clock by the time the whole tokens took, so
+            # frequent calls don't discard partially refilled tokens
+            tokens += refill
+            last += refill * _NS_PER_MINUTE // limit_per_minute
 
-        # Add current request
-        self.rate_limit_store[key].append(now)
+        allowed = tokens > 0
+        self.rate_limit_store[key] = (last, tokens - allowed)
 
-        return True
+        return allowed
 
-    def sanitize_user_input(self, user_input: str) -> str:
-        """Sanitize user input to prevent injection attacks"""
-        # Remove potentially dangerous characters
-        sanitized = user_input
+    def sanitize_for_llm(self, user_input: str) -> str:
+        """
+        Cheap sanitization for text that is only sent to the LLM
 
-        # Remove script tags
-        sanitized = re.sub(r'<script[^>]*>.*?</script>', '', sanitized, flags=re.DOTALL | re.IGNORECASE)
+        Messages never reach a database or a browser on this path, so only
+        null bytes are removed and the length is capped.
+        """
+        return user_input[:MAX_MESSAGE_LENGTH].replace("\x00", "").strip()
 
-        # Remove SQL injection attempts
-        sql_keywords = ['DROP', 'DELETE', 'INSERT', 'UPDATE', 'SELECT', '--', ';--']
-        for keyword in sql_keywords:
-            sanitized = sanitized.replace(keyword, '')
+    def sanitize_for_render(self, user_input: str) -> str:
+        """Sanitize user input that may be echoed into HTML or stored"""
+        # Remove script tags and SQL injection attempts
+        sanitized = _INJECTION_RE.sub('', user_input)
 
         # Limit length
-        max_length = 2000
-        if len(sanitized) > max_length:
-            sanitized = sanitized[:max_length]
+        if len(sanitized) > MAX_MESSAGE_LENGTH:
+            sanitized = sanitized[:MAX_MESSAGE_LENGTH]
 
         return sanitized.strip()
 
+    def sanitize_user_input(self, user_input: str) -> str:
+        """Sanitize user input to prevent injection attacks"""
+        return self.sanitize_for_render(user_input)
+
     def anonymize_for_logging(self, data: Dict) -> Dict:
         """Anonymize data for logging (GDPR compliance)"""
         anonymized = data.copy()
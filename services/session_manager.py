@@ -1,7 +1,6 @@
 """
 Session Manager - Handle session state with Redis
 """
-import json
 import sys
 from pathlib import Path
 from typing import Optional, Dict
@@ -22,6 +21,32 @@ except ImportError:
     REDIS_AVAILABLE = False
     print("⚠️  redis package not installed. Using in-memory storage.")
 
+# Try to import compact binary encoding for Redis payloads
+# (msgspec's msgpack codec is preferred; both emit the same wire format)
+try:
+    import msgspec
+
+    _packb = msgspec.msgpack.Encoder().encode
+    _unpackb = msgspec.msgpack.Decoder().decode
+except ImportError:
+    try:
+        import msgpack
+
+        _packb = msgpack.packb
+        _unpackb = msgpack.unpackb
+    except ImportError:
+        _packb = _unpackb = None
+
+try:
+    import lz4.frame
+
+    COMPRESSION_AVAILABLE = _packb is not None
+except ImportError:
+    COMPRESSION_AVAILABLE = False
+
+# Leading byte of a msgpack+LZ4 payload (JSON payloads always start with "{")
+PACKED_FORMAT_V1 = b"\x01"
+
 
 class SessionManager:
     """
@@ -41,11 +66,13 @@ class SessionManager:
 
         if REDIS_AVAILABLE:
             try:
+                # Keep payloads as raw bytes so they can be handed straight
+                # to pydantic's JSON parser without a str round-trip
                 self.redis_client = redis.Redis(
                     host=redis_host,
                     port=redis_port,
                     db=0,
-                    decode_responses=True,
+                    decode_responses=False,
                     socket_connect_timeout=5
                 )
                 # Test connection
@@ -70,9 +97,6 @@ class SessionManager:
             True if successful
         """
         try:
-            # Serialize session to JSON
-            session_json = session.model_dump_json()
-
             # Generate Redis key
             key = f"session:{session.session_id}"
 
@@ -81,11 +105,11 @@ class SessionManager:
                 self.redis_client.setex(
                     name=key,
                     time=timedelta(seconds=SESSION_TTL),
-                    value=session_json
+                    value=self._encode_session(session)
                 )
             else:
                 # Save to in-memory store
-                self.memory_store[key] = session_json
+                self.memory_store[key] = session.model_dump_json()
 
             return True
 
@@ -93,6 +117,23 @@ class SessionManager:
             print(f"❌ Error saving session: {e}")
             return False
 
+    def _encode_session(self, session: SessionState) -> bytes:
+        """Serialize session for Redis (msgpack + LZ4 when available)"""
+        if COMPRESSION_AVAILABLE:
+            packed = _packb(session.model_dump(mode="json"))
+            return PACKED_FORMAT_V1 + lz4.frame.compress(packed, compression_level=0)
+
+        return session.model_dump_json().encode()
+
+    def _decode_session(self, payload) -> SessionState:
+        """Deserialize session, dispatching on the leading format byte"""
+        if payload[:1] == PACKED_FORMAT_V1:
+            packed = lz4.frame.decompress(payload[1:])
+            return SessionState.model_validate(_unpackb(packed))
+
+        # Plain JSON (str or bytes): parse and validate in a single pass
+        return SessionState.model_validate_json(payload)
+
     def load_session(self, session_id: str) -> Optional[SessionState]:
         """
         Load session from Redis or memory
@@ -114,9 +155,7 @@ class SessionManager:
                 session_json = self.memory_store.get(key)
 
             if session_json:
-                # Deserialize from JSON
-                session_dict = json.loads(session_json) if isinstance(session_json, str) else session_json
-                return SessionState(**session_dict)
+                return self._decode_session(session_json)
 
             return None
 
@@ -185,11 +224,12 @@ class SessionManager:
                 # Scan Redis for session keys
                 session_keys = []
                 for key in self.redis_client.scan_iter(match="session:*"):
+                    key = key.decode()
                     if user_id:
                         # Load and check user_id
                         session_json = self.redis_client.get(key)
                         if session_json:
-                            session = SessionState(**json.loads(session_json))
+                            session = self._decode_session(session_json)
                             if session.user_id == user_id:
                                 session_keys.append(key.replace("session:", ""))
                     else:
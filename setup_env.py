@@ -1,9 +1,19 @@
 """
 Generate .env file from template with secure defaults
 """
+import re
 import secrets
 from pathlib import Path
 
+# Settings whose value in .env.example is replaced with a generated one
+_GENERATED = {
+    "SECRET_KEY": lambda: generate_secret_key(32),
+}
+_GENERATED_RE = re.compile(
+    r'^(' + '|'.join(map(re.escape, _GENERATED)) + r')=[^\r\n]*$',
+    re.MULTILINE
+)
+
 
 def generate_secret_key(length=32):
     """Generate secure random secret key"""
@@ -33,10 +43,10 @@ def create_env_file():
         # Fallback to latin-1
         content = env_example.read_text(encoding='latin-1')
 
-    # Replace placeholders
-    content = content.replace(
-        "your-secret-key-change-in-production",
-        generate_secret_key(32)
+    # Replace placeholder values in one pass (other settings are left as-is)
+    content = _GENERATED_RE.sub(
+        lambda match: f"{match.group(1)}={_GENERATED[match.group(1)]()}",
+        content
     )
 
     # Write .env with UTF-8
@@ -3,6 +3,7 @@ Utilities package
 """
 from .validators import (
     validate_email,
+    validate_emails,
     validate_session_id,
     validate_user_input,
     sanitize_filename,
@@ -13,7 +14,9 @@ from .text_simplifier import (
     TextSimplifier,
     simplify_text,
     count_syllables,
-    calculate_reading_level
+    calculate_reading_level,
+    split_into_chunks,
+    iter_chunks
 )
 from .speech_service import (
     SpeechService,
@@ -24,6 +27,7 @@ from .speech_service import (
 __all__ = [
     # Validators
     "validate_email",
+    "validate_emails",
     "validate_session_id",
     "validate_user_input",
     "sanitize_filename",
@@ -35,6 +39,8 @@ __all__ = [
     "simplify_text",
     "count_syllables",
     "calculate_reading_level",
+    "split_into_chunks",
+    "iter_chunks",
 
     # Speech Service
     "SpeechService",
@@ -8,9 +8,77 @@ In production, integrate with:
 - OpenAI Whisper (for STT)
 - ElevenLabs (for high-quality TTS)
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterator
+from collections import OrderedDict
+from pathlib import Path
+import asyncio
 import base64
+import hashlib
+import importlib
 import io
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import wave
+
+import httpx
+
+from .text_simplifier import iter_chunks
+
+# Try to import pybase64 (SIMD-accelerated) for audio <-> base64 conversion
+try:
+    import pybase64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
+# Try to import h2 so REST provider calls can share HTTP/2 connections
+try:
+    import h2
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Maximum number of synthesized clips / transcripts kept in memory
+TTS_CACHE_SIZE = 256
+STT_CACHE_SIZE = 256
+
+# ElevenLabs REST API (voice "Rachel" is the default)
+ELEVENLABS_TTS_URL = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+ELEVENLABS_DEFAULT_VOICE_ID = "21m00Tcm4TlvDq8ikWAM"
+
+# ffprobe reads container durations without decoding (None if not on PATH)
+_FFPROBE = shutil.which("ffprobe")
+
+# Provider SDK modules, imported ahead of the first request by warmup()
+_PROVIDER_SDKS = {
+    "google": ("google.cloud.texttospeech", "google.cloud.speech"),
+    "aws": ("boto3",),
+    "azure": ("azure.cognitiveservices.speech",),
+    "openai": ("openai",),
+}
+
+# Async TTS requests arriving within TTS_BATCH_WAIT seconds of each other are
+# coalesced into one batch of at most TTS_BATCH_SIZE requests
+TTS_BATCH_SIZE = 8
+TTS_BATCH_WAIT = 0.02
+
+# MPEG audio Layer III frame header tables (bit rates in kbit/s), used to
+# find the length of a clip's leading Xing/Info/VBRI frame
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),  # MPEG-2
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),  # MPEG-2.5
+}
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
 
 
 class SpeechService:
@@ -21,17 +89,44 @@ class SpeechService:
     In production, replace with actual API calls.
     """
 
-    def __init__(self, provider: str = "mock"):
+    def __init__(
+            self,
+            provider: str = "mock",
+            disk_cache: bool = False,
+            background_warmup: bool = False
+    ):
         """
         Initialize speech service
 
         Args:
             provider: Service provider (mock, google, aws, azure, openai)
+            disk_cache: Also persist synthesized audio under $TMPDIR/tts-cache/
+            background_warmup: Run warmup() in a daemon thread right away
         """
         self.provider = provider
         self.tts_enabled = False
         self.stt_enabled = False
 
+        # Result caches (identical requests skip the provider round-trip)
+        self._tts_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._stt_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Guards both LRUs: synthesis also runs in worker threads
+        # (to_thread batches, warmup)
+        self._cache_lock = threading.Lock()
+        self._tts_cache_dir: Optional[Path] = None
+        if disk_cache:
+            self._tts_cache_dir = Path(tempfile.gettempdir()) / "tts-cache"
+            self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Provider SDK clients, created on first use and then reused so
+        # later calls skip client setup and the TCP/TLS handshake
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+
+        # Request pool for text_to_speech_async, bound to the running loop
+        self._tts_queue: Optional[asyncio.Queue] = None
+        self._tts_batch_task: Optional[asyncio.Task] = None
+
         # Voice settings
         self.default_voice = {
             "language": "en-US",
@@ -42,6 +137,59 @@ class SpeechService:
             "volume": 0.0
         }
 
+        if background_warmup:
+            threading.Thread(target=self.warmup, daemon=True).start()
+
+    def close(self):
+        """Close the pooled HTTP connections"""
+        http = self._clients.pop("http", None)
+        if http is not None:
+            http.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def warmup(self, text: str = " "):
+        """
+        Open the provider connection ahead of the first real request
+
+        Imports the provider SDK, builds its client and sends a throwaway
+        synthesis, so the import, TCP/TLS handshake and auth happen here
+        instead of on a user's first request.
+
+        Args:
+            text: Text for the throwaway synthesis
+        """
+        if self.provider == "mock":
+            return
+
+        _preload_sdk(self.provider)
+
+        try:
+            if self.provider == "azure":
+                import azure.cognitiveservices.speech as speechsdk
+
+                synthesizer = self._azure_synthesizer(speechsdk, "en-US-JennyNeural")
+                speechsdk.Connection.from_speech_synthesizer(synthesizer).open(True)
+            elif self.provider == "openai":
+                # STT-only provider: building the client is all there is to warm
+                from openai import OpenAI
+
+                self._get_client("openai", OpenAI)
+            else:
+                self.text_to_speech(text)
+        except Exception as e:
+            print(f"⚠️  Speech warmup failed: {e}")
+
     def text_to_speech(
             self,
             text: str,
@@ -65,19 +213,76 @@ class SpeechService:
         Returns:
             Audio bytes in specified format
         """
+        key = self._tts_cache_key(text, voice, language, speed, pitch, output_format)
+
+        audio = self._get_cached_audio(key)
+        if audio is not None:
+            return audio
+
         if self.provider == "mock":
-            return self._mock_text_to_speech(text, output_format)
+            audio = self._mock_text_to_speech(text, output_format)
         elif self.provider == "google":
-            return self._google_text_to_speech(text, voice, language, speed, pitch)
+            audio = self._google_text_to_speech(text, voice, language, speed, pitch)
         elif self.provider == "aws":
-            return self._aws_text_to_speech(text, voice, language, speed)
+            audio = self._aws_text_to_speech(text, voice, language, speed)
         elif self.provider == "azure":
-            return self._azure_text_to_speech(text, voice, language, speed, pitch)
+            audio = self._azure_text_to_speech(text, voice, language, speed, pitch)
         elif self.provider == "elevenlabs":
-            return self._elevenlabs_text_to_speech(text, voice)
+            audio = self._elevenlabs_text_to_speech(text, voice)
         else:
             raise ValueError(f"Unsupported TTS provider: {self.provider}")
 
+        # Empty audio means mock output or a provider failure; don't keep it
+        if audio:
+            self._cache_audio(key, audio)
+
+        return audio
+
+    def text_to_speech_stream(
+            self,
+            text: str,
+            voice: Optional[str] = None,
+            language: str = "en-US",
+            speed: float = 1.0,
+            pitch: float = 0.0,
+            output_format: str = "mp3"
+    ) -> Iterator[bytes]:
+        """
+        Convert text to speech, yielding audio as it is synthesized
+
+        ElevenLabs audio is streamed chunk by chunk, so playback can start
+        before synthesis finishes. Other providers yield the whole clip once.
+
+        Args:
+            Same as text_to_speech
+
+        Yields:
+            Audio byte chunks in specified format
+        """
+        if self.provider != "elevenlabs":
+            audio = self.text_to_speech(text, voice, language, speed, pitch, output_format)
+            if audio:
+                yield audio
+            return
+
+        key = self._tts_cache_key(text, voice, language, speed, pitch, output_format)
+
+        audio = self._get_cached_audio(key)
+        if audio is not None:
+            yield audio
+            return
+
+        chunks = []
+        try:
+            for chunk in self._elevenlabs_stream(text, voice):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"❌ ElevenLabs error: {e}")
+            return
+
+        self._cache_audio(key, b"".join(chunks))
+
     def speech_to_text(
             self,
             audio_bytes: bytes,
@@ -101,19 +306,299 @@ class SpeechService:
                 "words": [{"word": "hello", "start": 0.0, "end": 0.5}] (optional)
             }
         """
+        key = self._stt_cache_key(audio_bytes, language, enable_punctuation, enable_word_timestamps)
+
+        cached = self._get_cached_transcript(key)
+        if cached is not None:
+            return cached
+
         if self.provider == "mock":
-            return self._mock_speech_to_text(audio_bytes)
+            result = self._mock_speech_to_text(audio_bytes)
         elif self.provider == "google":
-            return self._google_speech_to_text(audio_bytes, language, enable_punctuation)
+            result = self._google_speech_to_text(audio_bytes, language, enable_punctuation)
         elif self.provider == "aws":
-            return self._aws_speech_to_text(audio_bytes, language)
+            result = self._aws_speech_to_text(audio_bytes, language)
         elif self.provider == "azure":
-            return self._azure_speech_to_text(audio_bytes, language)
+            result = self._azure_speech_to_text(audio_bytes, language)
         elif self.provider == "openai":
-            return self._openai_speech_to_text(audio_bytes, language)
+            result = self._openai_speech_to_text(audio_bytes, language)
         else:
             raise ValueError(f"Unsupported STT provider: {self.provider}")
 
+        self._cache_transcript(key, result)
+
+        return result
+
+    async def text_to_speech_async(
+            self,
+            text: str,
+            voice: Optional[str] = None,
+            language: str = "en-US",
+            speed: float = 1.0,
+            pitch: float = 0.0,
+            output_format: str = "mp3"
+    ) -> bytes:
+        """
+        Async version of text_to_speech
+
+        Requests are pooled and synthesized in batches (see _tts_batch_loop),
+        so concurrent callers share one round of provider calls and identical
+        requests in a batch are only synthesized once.
+
+        Returns:
+            Audio bytes in specified format
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._get_tts_queue().put(
+            ((text, voice, language, speed, pitch, output_format), future)
+        )
+        return await future
+
+    async def speech_to_text_async(
+            self,
+            audio_bytes: bytes,
+            language: str = "en-US",
+            enable_punctuation: bool = True,
+            enable_word_timestamps: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async version of speech_to_text
+
+        Whisper uses the native async OpenAI client; other providers run
+        the blocking call in a worker thread.
+
+        Returns:
+            Same shape as speech_to_text
+        """
+        if self.provider != "openai":
+            return await asyncio.to_thread(
+                self.speech_to_text, audio_bytes, language, enable_punctuation, enable_word_timestamps
+            )
+
+        key = self._stt_cache_key(audio_bytes, language, enable_punctuation, enable_word_timestamps)
+
+        cached = self._get_cached_transcript(key)
+        if cached is not None:
+            return cached
+
+        result = await self._openai_speech_to_text_async(audio_bytes, language)
+        self._cache_transcript(key, result)
+
+        return result
+
+    async def text_to_speech_long(
+            self,
+            text: str,
+            voice: Optional[str] = None,
+            language: str = "en-US",
+            speed: float = 1.0,
+            pitch: float = 0.0,
+            output_format: str = "mp3",
+            max_chars: int = 500
+    ) -> bytes:
+        """
+        Convert long text to speech by synthesizing its chunks concurrently
+
+        The text is split at sentence ends into chunks of about max_chars,
+        every chunk is synthesized in parallel, and the clips are joined in
+        their original order.
+
+        Args:
+            text: Text to convert
+            voice: Voice ID/name
+            language: Language code
+            speed: Speaking rate
+            pitch: Voice pitch
+            output_format: Audio format (mp3, wav, ogg)
+            max_chars: Target characters per synthesized chunk
+
+        Returns:
+            Audio bytes in specified format
+        """
+        chunks = [chunk for chunk in iter_chunks(text, max_chars=max_chars, overlap=0) if chunk.strip()]
+
+        clips = await asyncio.gather(*(
+            self.text_to_speech_async(chunk, voice, language, speed, pitch, output_format)
+            for chunk in chunks
+        ))
+
+        return concat_audio(clips, output_format)
+
+    # ============================================
+    # REQUEST BATCHING
+    # ============================================
+
+    def _get_tts_queue(self) -> asyncio.Queue:
+        """Get the TTS request pool, starting its batch loop on this event loop"""
+        loop = asyncio.get_running_loop()
+        task = self._tts_batch_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._tts_queue = asyncio.Queue()
+            self._tts_batch_task = loop.create_task(self._tts_batch_loop(self._tts_queue))
+        return self._tts_queue
+
+    async def _tts_batch_loop(self, queue: asyncio.Queue):
+        """
+        Drain the TTS request pool in batches
+
+        Waits for a request, then collects more until TTS_BATCH_SIZE requests
+        are pooled or TTS_BATCH_WAIT seconds pass. None of the providers offer
+        a multi-input endpoint, so the batch's distinct requests are
+        synthesized in parallel worker threads and each caller's future is
+        resolved with its audio.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + TTS_BATCH_WAIT
+
+            while len(batch) < TTS_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Coalesce identical requests
+            pending: Dict[tuple, list] = {}
+            for request, future in batch:
+                pending.setdefault(request, []).append(future)
+
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self.text_to_speech, *request) for request in pending),
+                return_exceptions=True
+            )
+
+            for futures, result in zip(pending.values(), results):
+                for future in futures:
+                    if future.done():  # Caller was cancelled
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+
+    # ============================================
+    # PROVIDER CLIENTS
+    # ============================================
+
+    def _get_client(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Get a cached provider client, creating it on first use
+
+        Args:
+            name: Cache key for the client
+            factory: Zero-argument callable that builds the client
+
+        Returns:
+            Shared client instance
+        """
+        client = self._clients.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._clients[name] = factory()
+        return client
+
+    def _get_http(self) -> httpx.Client:
+        """Get the pooled HTTP client for REST-style providers"""
+        return self._get_client("http", lambda: httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            timeout=httpx.Timeout(30.0)
+        ))
+
+    # ============================================
+    # RESULT CACHE
+    # ============================================
+
+    def _tts_cache_key(
+            self,
+            text: str,
+            voice: Optional[str],
+            language: str,
+            speed: float,
+            pitch: float,
+            output_format: str
+    ) -> str:
+        """Hash the text together with the options that affect the audio"""
+        return hashlib.sha256(
+            f"{self.provider}|{text}|{voice}|{language}|{speed}|{pitch}|{output_format}".encode()
+        ).hexdigest()
+
+    def _get_cached_audio(self, key: str) -> Optional[bytes]:
+        """Look up synthesized audio in memory, then on disk"""
+        with self._cache_lock:
+            audio = self._tts_cache.get(key)
+            if audio is not None:
+                self._tts_cache.move_to_end(key)
+                return audio
+
+        if self._tts_cache_dir is not None:
+            try:
+                with open(self._tts_cache_dir / key, 'rb') as f:
+                    audio = f.read()
+            except OSError:
+                return None
+            self._remember_audio(key, audio)
+            return audio
+
+        return None
+
+    def _cache_audio(self, key: str, audio: bytes):
+        """Store synthesized audio in memory and (atomically) on disk"""
+        self._remember_audio(key, audio)
+
+        if self._tts_cache_dir is not None:
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=self._tts_cache_dir)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(audio)
+                os.replace(temp_path, self._tts_cache_dir / key)
+            except OSError as e:
+                print(f"⚠️  Could not write TTS cache: {e}")
+
+    def _remember_audio(self, key: str, audio: bytes):
+        """Insert into the in-memory LRU, evicting the oldest entry"""
+        with self._cache_lock:
+            self._tts_cache[key] = audio
+            if len(self._tts_cache) > TTS_CACHE_SIZE:
+                self._tts_cache.popitem(last=False)
+
+    def _stt_cache_key(
+            self,
+            audio_bytes: bytes,
+            language: str,
+            enable_punctuation: bool,
+            enable_word_timestamps: bool
+    ) -> str:
+        """Hash the audio together with the options that affect the transcript"""
+        hasher = hashlib.sha256(audio_bytes)
+        hasher.update(f"|{self.provider}|{language}|{enable_punctuation}|{enable_word_timestamps}".encode())
+        return hasher.hexdigest()
+
+    def _get_cached_transcript(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a transcript, returning a copy the caller may modify"""
+        with self._cache_lock:
+            cached = self._stt_cache.get(key)
+            if cached is None:
+                return None
+            self._stt_cache.move_to_end(key)
+        return dict(cached)
+
+    def _cache_transcript(self, key: str, result: Dict[str, Any]):
+        """Store a transcript in the in-memory LRU"""
+        # Empty transcripts mean mock output or a provider failure
+        if result.get("transcript"):
+            with self._cache_lock:
+                self._stt_cache[key] = dict(result)
+                if len(self._stt_cache) > STT_CACHE_SIZE:
+                    self._stt_cache.popitem(last=False)
+
     def get_available_voices(self, language: Optional[str] = None) -> list:
         """
         Get list of available voices
@@ -200,7 +685,7 @@ class SpeechService:
         try:
             from google.cloud import texttospeech
 
-            client = texttospeech.TextToSpeechClient()
+            client = self._get_client("google_tts", texttospeech.TextToSpeechClient)
 
             synthesis_input = texttospeech.SynthesisInput(text=text)
 
@@ -244,7 +729,7 @@ class SpeechService:
         try:
             from google.cloud import speech
 
-            client = speech.SpeechClient()
+            client = self._get_client("google_stt", speech.SpeechClient)
 
             audio = speech.RecognitionAudio(content=audio_bytes)
 
@@ -296,7 +781,7 @@ class SpeechService:
         try:
             import boto3
 
-            polly = boto3.client('polly')
+            polly = self._get_client("aws_polly", lambda: boto3.client('polly'))
 
             response = polly.synthesize_speech(
                 Text=text,
@@ -342,14 +827,7 @@ class SpeechService:
         try:
             import azure.cognitiveservices.speech as speechsdk
 
-            speech_config = speechsdk.SpeechConfig(
-                subscription=os.getenv("AZURE_SPEECH_KEY"),
-                region=os.getenv("AZURE_SPEECH_REGION")
-            )
-
-            speech_config.speech_synthesis_voice_name = voice or "en-US-JennyNeural"
-
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config)
+            synthesizer = self._azure_synthesizer(speechsdk, voice or "en-US-JennyNeural")
 
             result = synthesizer.speak_text_async(text).get()
 
@@ -362,6 +840,18 @@ class SpeechService:
             print(f"❌ Azure TTS error: {e}")
             return self._mock_text_to_speech(text, "mp3")
 
+    def _azure_synthesizer(self, speechsdk, voice_name: str):
+        """Get the shared synthesizer for a voice (fixed at construction)"""
+        def build_synthesizer():
+            speech_config = speechsdk.SpeechConfig(
+                subscription=os.getenv("AZURE_SPEECH_KEY"),
+                region=os.getenv("AZURE_SPEECH_REGION")
+            )
+            speech_config.speech_synthesis_voice_name = voice_name
+            return speechsdk.SpeechSynthesizer(speech_config=speech_config)
+
+        return self._get_client(f"azure_tts:{voice_name}", build_synthesizer)
+
     def _azure_speech_to_text(self, audio_bytes: bytes, language: str) -> Dict[str, Any]:
         """Azure Speech STT integration"""
         # Similar to TTS, requires Azure SDK
@@ -381,25 +871,51 @@ class SpeechService:
         try:
             from openai import OpenAI
 
-            client = OpenAI()
+            client = self._get_client("openai", OpenAI)
 
-            # Write bytes to temporary file (Whisper API requires file)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-                f.write(audio_bytes)
-                temp_path = f.name
+            # Upload straight from memory; the name tells Whisper the format
+            audio_file = io.BytesIO(audio_bytes)
+            audio_file.name = "audio.mp3"
 
             # Transcribe
-            with open(temp_path, 'rb') as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=language[:2] if language else None  # e.g., "en" from "en-US"
-                )
+            transcript = client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                language=language[:2] if language else None  # e.g., "en" from "en-US"
+            )
 
-            # Cleanup
-            import os
-            os.unlink(temp_path)
+            return {
+                "transcript": transcript.text,
+                "confidence": 1.0  # Whisper doesn't provide confidence
+            }
+
+        except ImportError:
+            print("⚠️  openai not installed, using mock")
+            return self._mock_speech_to_text(audio_bytes)
+        except Exception as e:
+            print(f"❌ Whisper error: {e}")
+            return self._mock_speech_to_text(audio_bytes)
+
+    async def _openai_speech_to_text_async(self, audio_bytes: bytes, language: str) -> Dict[str, Any]:
+        """
+        OpenAI Whisper integration (AsyncOpenAI client)
+
+        Requires: pip install openai
+        """
+        try:
+            from openai import AsyncOpenAI
+
+            client = self._get_client("openai_async", AsyncOpenAI)
+
+            # Upload straight from memory; the name tells Whisper the format
+            audio_file = io.BytesIO(audio_bytes)
+            audio_file.name = "audio.mp3"
+
+            transcript = await client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                language=language[:2] if language else None
+            )
 
             return {
                 "transcript": transcript.text,
@@ -419,30 +935,38 @@ class SpeechService:
 
     def _elevenlabs_text_to_speech(self, text: str, voice: Optional[str]) -> bytes:
         """
-        ElevenLabs TTS integration
+        ElevenLabs TTS integration (REST streaming endpoint)
 
-        Requires: pip install elevenlabs
+        Requires: ELEVENLABS_API_KEY
         """
         try:
-            from elevenlabs import generate, set_api_key
-            import os
+            return b"".join(self._elevenlabs_stream(text, voice))
 
-            set_api_key(os.getenv("ELEVENLABS_API_KEY"))
+        except Exception as e:
+            print(f"❌ ElevenLabs error: {e}")
+            return self._mock_text_to_speech(text, "mp3")
 
-            audio = generate(
-                text=text,
-                voice=voice or "Rachel",  # Default voice
-                model="eleven_monolingual_v1"
-            )
+    def _elevenlabs_stream(self, text: str, voice: Optional[str]) -> Iterator[bytes]:
+        """Yield ElevenLabs audio chunks as they arrive"""
+        url = ELEVENLABS_TTS_URL.format(voice_id=voice or ELEVENLABS_DEFAULT_VOICE_ID)
+
+        with self._get_http().stream(
+            "POST",
+            url,
+            json={"text": text, "model_id": "eleven_monolingual_v1"},
+            headers={"xi-api-key": os.getenv("ELEVENLABS_API_KEY", "")}
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes()
 
-            return audio
 
+def _preload_sdk(provider: str):
+    """Import a provider's SDK modules so later per-call imports are cache hits"""
+    for module_name in _PROVIDER_SDKS.get(provider, ()):
+        try:
+            importlib.import_module(module_name)
         except ImportError:
-            print("⚠️  elevenlabs not installed, using mock")
-            return self._mock_text_to_speech(text, "mp3")
-        except Exception as e:
-            print(f"❌ ElevenLabs error: {e}")
-            return self._mock_text_to_speech(text, "mp3")
+            pass  # The provider call falls back to mock and warns
 
 
 # ============================================
@@ -494,6 +1018,47 @@ def speech_to_text(
     return result.get("transcript", "")
 
 
+async def text_to_speech_async(
+        text: str,
+        voice: Optional[str] = None,
+        language: str = "en-US",
+        speed: float = 1.0,
+        pitch: float = 0.0
+) -> bytes:
+    """
+    Convert text to speech without blocking the event loop (convenience function)
+
+    Args:
+        text: Text to convert
+        voice: Voice ID
+        language: Language code
+        speed: Speaking rate
+        pitch: Voice pitch
+
+    Returns:
+        Audio bytes
+    """
+    return await _speech_service.text_to_speech_async(text, voice, language, speed, pitch)
+
+
+async def speech_to_text_async(
+        audio_bytes: bytes,
+        language: str = "en-US"
+) -> str:
+    """
+    Convert speech to text without blocking the event loop (convenience function)
+
+    Args:
+        audio_bytes: Audio data
+        language: Language code
+
+    Returns:
+        Transcribed text
+    """
+    result = await _speech_service.speech_to_text_async(audio_bytes, language)
+    return result.get("transcript", "")
+
+
 def set_speech_provider(provider: str):
     """
     Set global speech service provider
@@ -502,7 +1067,7 @@ def set_speech_provider(provider: str):
         provider: Provider name (mock, google, aws, azure, openai)
     """
     global _speech_service
-    _speech_service = SpeechService(provider=provider)
+    _speech_service = SpeechService(provider=provider, background_warmup=True)
     print(f"✅ Speech provider set to: {provider}")
 
 
@@ -520,7 +1085,30 @@ def audio_bytes_to_base64(audio_bytes: bytes) -> str:
     Returns:
         Base64 encoded string
     """
-    return base64.b64encode(audio_bytes).decode('utf-8')
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(audio_bytes)
+    return base64.b64encode(audio_bytes).decode('ascii')
+
+
+def iter_audio_base64(audio_bytes: bytes, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    Base64-encode audio piece by piece (e.g. for WebSocket streaming)
+
+    Concatenating the yielded strings gives audio_bytes_to_base64(audio_bytes).
+
+    Args:
+        audio_bytes: Audio data
+        chunk_size: Approximate input bytes per piece
+
+    Yields:
+        Base64 encoded strings
+    """
+    # Whole 3-byte groups per piece, so no piece carries '=' padding
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    view = memoryview(audio_bytes)
+
+    for start in range(0, len(view), chunk_size):
+        yield audio_bytes_to_base64(view[start:start + chunk_size])
 
 
 def base64_to_audio_bytes(base64_string: str) -> bytes:
@@ -533,9 +1121,133 @@ def base64_to_audio_bytes(base64_string: str) -> bytes:
     Returns:
         Audio bytes
     """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64decode(base64_string)
     return base64.b64decode(base64_string)
 
 
+def concat_audio(clips: list, output_format: str = "mp3") -> bytes:
+    """
+    Join audio clips of the same format end to end
+
+    The container is read from each clip's magic bytes; output_format is
+    only a fallback, since providers may return MP3 whatever was asked.
+
+    Args:
+        clips: Audio clips, in playback order
+        output_format: Expected format of every clip (mp3, wav, ogg)
+
+    Returns:
+        Combined audio bytes
+    """
+    clips = [clip for clip in clips if clip]
+    if len(clips) <= 1:
+        return clips[0] if clips else b""
+
+    formats = {_sniff_audio_format(clip) or output_format for clip in clips}
+    audio_format = formats.pop() if len(formats) == 1 else None
+
+    # MP3 is a sequence of self-contained frames; only the per-clip
+    # headers have to go, or players take the first clip's Xing frame
+    # as the length of the whole stream
+    if audio_format == "mp3":
+        last = len(clips) - 1
+        return b"".join(
+            _strip_mp3_headers(clip, keep_id3=i == 0, keep_id3v1=i == last)
+            for i, clip in enumerate(clips)
+        )
+
+    # WAV: copy the PCM frames under a single header
+    if audio_format == "wav":
+        out = io.BytesIO()
+        with wave.open(io.BytesIO(clips[0])) as first, wave.open(out, 'wb') as combined:
+            combined.setparams(first.getparams())
+            for clip in clips:
+                with wave.open(io.BytesIO(clip)) as wav:
+                    combined.writeframes(wav.readframes(wav.getnframes()))
+        return out.getvalue()
+
+    # Other or mixed containers need a decode / re-encode
+    try:
+        from pydub import AudioSegment
+
+        combined = sum(
+            (AudioSegment.from_file(io.BytesIO(clip), format=_sniff_audio_format(clip)) for clip in clips),
+            AudioSegment.empty()
+        )
+        out = io.BytesIO()
+        combined.export(out, format=output_format)
+        return out.getvalue()
+
+    except ImportError:
+        print(f"⚠️  pydub not installed, returning first of {len(clips)} {output_format} clips")
+        return clips[0]
+
+
+def _sniff_audio_format(audio_bytes: bytes) -> Optional[str]:
+    """Container format from the leading magic bytes, or None if unknown"""
+    if audio_bytes[:4] == b'RIFF':
+        return "wav"
+    if audio_bytes[:4] == b'OggS':
+        return "ogg"
+    if audio_bytes[:3] == b'ID3' or (
+            len(audio_bytes) >= 2 and audio_bytes[0] == 0xFF and audio_bytes[1] & 0xE0 == 0xE0
+    ):
+        return "mp3"
+    return None
+
+
+def _strip_mp3_headers(clip: bytes, keep_id3: bool = False, keep_id3v1: bool = False) -> bytes:
+    """
+    Remove an MP3 clip's tags and Xing/Info/VBRI header frame
+
+    Args:
+        clip: MP3 data
+        keep_id3: Keep the leading ID3v2 tag
+        keep_id3v1: Keep the trailing 128-byte ID3v1 tag
+
+    Returns:
+        The clip's audio frames (plus any kept tags)
+    """
+    head = b""
+    start = 0
+
+    # ID3v2: 10-byte header with a syncsafe size, plus a footer if flagged
+    if clip[:3] == b'ID3' and len(clip) >= 10:
+        size = (clip[6] & 0x7F) << 21 | (clip[7] & 0x7F) << 14 | (clip[8] & 0x7F) << 7 | (clip[9] & 0x7F)
+        start = 10 + size + (10 if clip[5] & 0x10 else 0)
+        if keep_id3:
+            head = clip[:start]
+
+    end = len(clip)
+    if not keep_id3v1 and end - start >= 128 and clip[end - 128:end - 125] == b'TAG':
+        end -= 128
+
+    # First frame: drop it if it is a Xing/Info (LAME) or VBRI header
+    header = clip[start:start + 4]
+    if len(header) == 4 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0:
+        version = (header[1] >> 3) & 3
+        layer = (header[1] >> 1) & 3
+        bitrate_index = header[2] >> 4
+        sample_rate_index = (header[2] >> 2) & 3
+
+        if layer == 1 and version in _MP3_BITRATES and 0 < bitrate_index < 15 and sample_rate_index < 3:
+            mono = header[3] >> 6 == 3
+            if version == 3:
+                side_info = 17 if mono else 32
+                frame_length = 144000 * _MP3_BITRATES[version][bitrate_index] // _MP3_SAMPLE_RATES[version][sample_rate_index]
+            else:
+                side_info = 9 if mono else 17
+                frame_length = 72000 * _MP3_BITRATES[version][bitrate_index] // _MP3_SAMPLE_RATES[version][sample_rate_index]
+            frame_length += (header[2] >> 1) & 1
+
+            xing_offset = start + 4 + side_info
+            if clip[xing_offset:xing_offset + 4] in (b'Xing', b'Info') or clip[start + 36:start + 40] == b'VBRI':
+                start += frame_length
+
+    return head + clip[start:end]
+
+
 def get_audio_duration(audio_bytes: bytes) -> float:
     """
     Get audio duration in seconds (approximate)
@@ -546,8 +1258,46 @@ def get_audio_duration(audio_bytes: bytes) -> float:
     Returns:
         Duration in seconds
     """
-    # This is a simplified placeholder
-    # In production, use a library like pydub or mutagen
+    # Read the duration from the container header where possible, instead
+    # of decoding the whole clip
+
+    # WAV (PCM): frame count / sample rate
+    if audio_bytes[:4] == b'RIFF':
+        try:
+            with wave.open(io.BytesIO(audio_bytes)) as wav:
+                return wav.getnframes() / wav.getframerate()
+        except (wave.Error, EOFError, ZeroDivisionError):
+            pass
+
+    # MP3 / OGG / FLAC / M4A: mutagen only parses headers and frame indexes
+    try:
+        import mutagen
+
+        audio_file = mutagen.File(io.BytesIO(audio_bytes))
+        if audio_file is not None and audio_file.info is not None:
+            return float(audio_file.info.length)
+    except Exception:
+        pass  # mutagen not installed, or it could not parse the header
+
+    # Other containers: ffprobe parses the header without decoding
+    if _FFPROBE is not None:
+        try:
+            result = subprocess.run(
+                [
+                    _FFPROBE, '-v', 'error',
+                    '-show_entries', 'format=duration',
+                    '-of', 'default=noprint_wrappers=1:nokey=1',
+                    '-i', 'pipe:0'
+                ],
+                input=audio_bytes,
+                capture_output=True,
+                timeout=5
+            )
+            return float(result.stdout)
+        except (OSError, subprocess.SubprocessError, ValueError):
+            pass  # Unreadable input or "N/A" duration
+
+    # Last resort: decode with pydub
     try:
         from pydub import AudioSegment
 
@@ -557,4 +1307,4 @@ def get_audio_duration(audio_bytes: bytes) -> float:
     except ImportError:
         # Fallback: rough estimate based on file size
         # Assuming MP3 at 128kbps: 1 second ≈ 16KB
-        return len(audio_bytes) / 16000.0
\ No newline at end of file
+        return len(audio_bytes) / 16000.0
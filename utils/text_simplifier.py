@@ -1,8 +1,181 @@
 """
 Text simplification utilities for accessibility
 """
+import bisect
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# Try to import pyahocorasick for linear-time vocabulary matching on long text
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Texts at least this long use the Aho-Corasick automaton (when installed);
+# shorter ones are faster through the compiled regex
+AHOCORASICK_MIN_CHARS = 10_000
+
+# Maximum number of (text, level) results kept by TextSimplifier.simplify
+SIMPLIFY_CACHE_SIZE = 4096
+
+# Reading-level helpers run once per adapted response, so their patterns
+# and lookup sets are built once here rather than on every call
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_CONJUNCTION_SPLIT_RE = re.compile(r',\s+(?:and|but|or|so)\s+')
+
+# Byte -> b'1' for a vowel, b'0' otherwise; vowel groups are then counted
+# by C-level bytes.count instead of a per-character Python loop
+_SYLLABLE_TABLE = bytes(ord('1') if chr(i) in 'aeiouy' else ord('0') for i in range(256))
+
+# Byte lookup tables for the vectorized syllable count
+_IS_LETTER = np.zeros(256, dtype=bool)
+_IS_LETTER[ord('a'):ord('z') + 1] = True
+_IS_VOWEL = np.zeros(256, dtype=bool)
+_IS_VOWEL[list(b'aeiouy')] = True
+
+# Vocabulary replacement tables. Each table is compiled once at import into
+# a single whole-word alternation (longest phrase first, so "competency
+# framework" wins over "competency") and applied in one scan of the text.
+_SIMPLE_REPLACEMENTS = {
+    # Business terms
+    "competency": "skill",
+    "framework": "plan",
+    "assessment": "test",
+    "evaluate": "check",
+    "implement": "start",
+    "facilitate": "help",
+    "optimize": "make better",
+    "collaborate": "work together",
+    "strategic": "planned",
+    "utilize": "use",
+    "leverage": "use",
+    "synergy": "working well together",
+    "bandwidth": "time and energy",
+    "deliverable": "finished work",
+
+    # HR terms
+    "competency framework": "skill plan",
+    "360-degree feedback": "asking everyone what you're good at",
+    "behavioral indicators": "things you do",
+    "talent development": "helping people get better",
+    "stakeholder": "person involved",
+    "inter-brand mobility": "moving between teams",
+    "cascade": "spread out",
+
+    # Complex verbs
+    "prioritize": "decide what's most important",
+    "demonstrate": "show",
+    "maintain": "keep",
+    "establish": "set up",
+    "determine": "figure out",
+    "acquire": "get",
+    "comprehend": "understand",
+    "commence": "start",
+    "conclude": "end",
+    "construct": "build",
+
+    # Abstract nouns
+    "methodology": "way of doing things",
+    "paradigm": "pattern",
+    "infrastructure": "basic setup",
+    "criterion": "rule",
+    "component": "part",
+}
+
+_MODERATE_REPLACEMENTS = {
+    "competency framework": "skill plan",
+    "behavioral indicators": "observable actions",
+    "360-degree feedback": "feedback from all directions",
+    "inter-brand mobility": "moving between brand teams",
+    "stakeholder": "people who are affected",
+    "cascade": "roll out step by step",
+    "entrepreneurship": "innovation and new ideas",
+}
+
+
+def _compile_replacements(replacements: Dict[str, str]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """Compile a replacement table into one case-insensitive pattern and a lookup"""
+    alternation = '|'.join(
+        re.escape(complex_word)
+        for complex_word in sorted(replacements, key=len, reverse=True)
+    )
+    lookup = {complex_word.lower(): simple_word for complex_word, simple_word in replacements.items()}
+    # (?a:...) folds case for ASCII only, so every match lowercases to a
+    # lookup key; Unicode folding would also match e.g. 'ſ' (U+017F) for
+    # 's', which .lower() leaves alone. \b stays Unicode-aware.
+    return re.compile(r'\b(?a:' + alternation + r')\b', re.IGNORECASE), lookup
+
+
+def _build_automaton(lookup: Dict[str, str]):
+    """Build an Aho-Corasick automaton over a lowercase lookup, or None"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for complex_word, simple_word in lookup.items():
+        automaton.add_word(complex_word, (len(complex_word), simple_word))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether char counts as a word character for \\b"""
+    return char.isalnum() or char == '_'
+
+
+def _replace_words_automaton(text: str, lowered: str, automaton) -> str:
+    """
+    Replace whole-word matches found by the automaton
+
+    Picks the same matches as the regex path: leftmost first, longest at
+    each position, no overlaps.
+    """
+    matches = []
+    for end, (length, simple_word) in automaton.iter(lowered):
+        start = end - length + 1
+        end += 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < len(text) and _is_word_char(text[end]):
+            continue
+        matches.append((start, -length, simple_word))
+
+    matches.sort()
+
+    pieces = []
+    position = 0
+    for start, negative_length, simple_word in matches:
+        if start < position:
+            continue
+        pieces.append(text[position:start])
+        pieces.append(simple_word)
+        position = start - negative_length
+    pieces.append(text[position:])
+
+    return ''.join(pieces)
+
+
+def _replace_words(text: str, pattern: re.Pattern, lookup: Dict[str, str], automaton=None) -> str:
+    """Replace every match of a compiled replacement table in one pass"""
+    if automaton is not None and len(text) >= AHOCORASICK_MIN_CHARS:
+        lowered = text.lower()
+        # Lowercasing a few non-ASCII characters changes the length,
+        # which would misalign match offsets
+        if len(lowered) == len(text):
+            return _replace_words_automaton(text, lowered, automaton)
+
+    return pattern.sub(lambda match: lookup[match.group(0).lower()], text)
+
+
+_SIMPLE_RE, _SIMPLE_LOOKUP = _compile_replacements(_SIMPLE_REPLACEMENTS)
+_MODERATE_RE, _MODERATE_LOOKUP = _compile_replacements(_MODERATE_REPLACEMENTS)
+_SIMPLE_AUTOMATON = _build_automaton(_SIMPLE_LOOKUP)
+_MODERATE_AUTOMATON = _build_automaton(_MODERATE_LOOKUP)
 
 
 class TextSimplifier:
@@ -19,65 +192,22 @@ class TextSimplifier:
         self.simple_replacements = self._load_simple_replacements()
         self.moderate_replacements = self._load_moderate_replacements()
 
+        # One specialized pipeline per level, so simplify() is a dict lookup
+        self._level_simplifiers: Dict[str, Callable[[str], str]] = {
+            # Very basic vocabulary, short sentences
+            "simple": self._make_level_simplifier(_SIMPLE_RE, _SIMPLE_LOOKUP, _SIMPLE_AUTOMATON, 12),
+            # Less aggressive vocabulary, moderate sentence shortening
+            "moderate": self._make_level_simplifier(_MODERATE_RE, _MODERATE_LOOKUP, _MODERATE_AUTOMATON, 20),
+        }
+
     def _load_simple_replacements(self) -> Dict[str, str]:
         """Load simple vocabulary replacements"""
-        return {
-            # Business terms
-            "competency": "skill",
-            "framework": "plan",
-            "assessment": "test",
-            "evaluate": "check",
-            "implement": "start",
-            "facilitate": "help",
-            "optimize": "make better",
-            "collaborate": "work together",
-            "strategic": "planned",
-            "utilize": "use",
-            "leverage": "use",
-            "synergy": "working well together",
-            "bandwidth": "time and energy",
-            "deliverable": "finished work",
-
-            # HR terms
-            "competency framework": "skill plan",
-            "360-degree feedback": "asking everyone what you're good at",
-            "behavioral indicators": "things you do",
-            "talent development": "helping people get better",
-            "stakeholder": "person involved",
-            "inter-brand mobility": "moving between teams",
-            "cascade": "spread out",
-
-            # Complex verbs
-            "prioritize": "decide what's most important",
-            "demonstrate": "show",
-            "maintain": "keep",
-            "establish": "set up",
-            "determine": "figure out",
-            "acquire": "get",
-            "comprehend": "understand",
-            "commence": "start",
-            "conclude": "end",
-            "construct": "build",
-
-            # Abstract nouns
-            "methodology": "way of doing things",
-            "paradigm": "pattern",
-            "infrastructure": "basic setup",
-            "criterion": "rule",
-            "component": "part",
-        }
+        # A copy, so edits on one instance don't leak into the shared table
+        return dict(_SIMPLE_REPLACEMENTS)
 
     def _load_moderate_replacements(self) -> Dict[str, str]:
         """Load moderate complexity replacements"""
-        return {
-            "competency framework": "skill plan",
-            "behavioral indicators": "observable actions",
-            "360-degree feedback": "feedback from all directions",
-            "inter-brand mobility": "moving between brand teams",
-            "stakeholder": "people who are affected",
-            "cascade": "roll out step by step",
-            "entrepreneurship": "innovation and new ideas",
-        }
+        return dict(_MODERATE_REPLACEMENTS)
 
     def simplify(self, text: str, level: str = "simple") -> str:
         """
@@ -90,30 +220,65 @@ class TextSimplifier:
         Returns:
             Simplified text
         """
-        if level == "advanced":
+        # With the default tables the output depends only on the module,
+        # so results are cached across instances; edited or overridden
+        # tables are applied directly
+        if (self.simple_replacements == _SIMPLE_REPLACEMENTS
+                and self.moderate_replacements == _MODERATE_REPLACEMENTS):
+            return _simplify_cached(text, level)
+        return self._simplify_custom(text, level)
+
+    @staticmethod
+    def cache_clear():
+        """Drop all cached simplify() results"""
+        _simplify_cached.cache_clear()
+
+    def _simplify(self, text: str, level: str) -> str:
+        """Uncached simplify(); advanced and unknown levels pass text through"""
+        level_simplifier = self._level_simplifiers.get(level)
+        if level_simplifier is None:
             return text
+        return level_simplifier(text)
 
-        simplified = text
-
+    def _simplify_custom(self, text: str, level: str) -> str:
+        """Uncached simplify() using this instance's replacement tables"""
         if level == "simple":
-            # Apply simple replacements
-            for complex_word, simple_word in self.simple_replacements.items():
-                pattern = re.compile(re.escape(complex_word), re.IGNORECASE)
-                simplified = pattern.sub(simple_word, simplified)
+            replacements, max_words = self.simple_replacements, 12
+        elif level == "moderate":
+            replacements, max_words = self.moderate_replacements, 20
+        else:
+            return text
 
-            # Shorten sentences
-            simplified = self._shorten_sentences(simplified, max_words=12)
+        # re caches the compiled alternation, so an unchanged table is
+        # only compiled once
+        pattern, lookup = _compile_replacements(replacements)
+        return self._shorten_sentences(_replace_words(text, pattern, lookup), max_words)
+
+    def _make_level_simplifier(
+        self,
+        pattern: re.Pattern,
+        lookup: Dict[str, str],
+        automaton,
+        max_words: int
+    ) -> Callable[[str], str]:
+        """
+        Build the simplify pipeline for one level
 
-        elif level == "moderate":
-            # Apply moderate replacements
-            for complex_phrase, simpler_phrase in self.moderate_replacements.items():
-                pattern = re.compile(re.escape(complex_phrase), re.IGNORECASE)
-                simplified = pattern.sub(simpler_phrase, simplified)
+        Args:
+            pattern: Compiled vocabulary alternation
+            lookup: Lowercase word -> replacement
+            automaton: Aho-Corasick automaton, or None
+            max_words: Maximum words per sentence
 
-            # Moderate sentence shortening
-            simplified = self._shorten_sentences(simplified, max_words=20)
+        Returns:
+            Function mapping text to simplified text
+        """
+        shorten_sentences = self._shorten_sentences
 
-        return simplified
+        def simplify_level(text: str) -> str:
+            return shorten_sentences(_replace_words(text, pattern, lookup, automaton), max_words)
+
+        return simplify_level
 
     def _shorten_sentences(self, text: str, max_words: int = 15) -> str:
         """
@@ -130,13 +295,10 @@ class TextSimplifier:
         shortened = []
 
         for sentence in sentences:
-            word_count = len(sentence.split())
-
-            if word_count > max_words:
+            # Only split far enough to tell whether there are > max_words
+            if len(sentence.split(None, max_words)) > max_words:
                 # Try to split on conjunctions
-                parts = re.split(r',\s+(?:and|but|or|so)\s+', sentence)
-                for part in parts:
-                    shortened.append(part.strip())
+                shortened.extend(part.strip() for part in _CONJUNCTION_SPLIT_RE.split(sentence))
             else:
                 shortened.append(sentence.strip())
 
@@ -175,6 +337,16 @@ class TextSimplifier:
         return text
 
 
+# Global simplifier instance
+_simplifier = TextSimplifier()
+
+
+@lru_cache(maxsize=SIMPLIFY_CACHE_SIZE)
+def _simplify_cached(text: str, level: str) -> str:
+    """Memoized TextSimplifier.simplify (repeated headings, labels, etc.)"""
+    return _simplifier._simplify(text, level)
+
+
 def simplify_text(text: str, level: str = "simple") -> str:
     """
     Convenience function to simplify text
@@ -186,8 +358,7 @@ def simplify_text(text: str, level: str = "simple") -> str:
     Returns:
         Simplified text
     """
-    simplifier = TextSimplifier()
-    return simplifier.simplify(text, level)
+    return _simplifier.simplify(text, level)
 
 
 def count_syllables(word: str) -> int:
@@ -206,16 +377,9 @@ def count_syllables(word: str) -> int:
     if word.endswith('e'):
         word = word[:-1]
 
-    # Count vowel groups
-    vowels = 'aeiouy'
-    syllable_count = 0
-    previous_was_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not previous_was_vowel:
-            syllable_count += 1
-        previous_was_vowel = is_vowel
+    # Count vowel groups (non-ASCII characters become '?', a non-vowel)
+    mapped = word.encode('ascii', 'replace').translate(_SYLLABLE_TABLE)
+    syllable_count = mapped.count(b'01') + mapped.startswith(b'1')
 
     # Ensure at least one syllable
     return max(1, syllable_count)
@@ -232,29 +396,21 @@ def calculate_reading_level(text: str) -> str:
         Reading level (elementary, middle, high, college, professional)
     """
     # Split into sentences
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
 
     if not sentences:
         return "elementary"
 
     # Count words and syllables
-    total_words = 0
-    total_syllables = 0
-
-    for sentence in sentences:
-        words = sentence.split()
-        total_words += len(words)
-
-        for word in words:
-            # Clean word
-            clean_word = re.sub(r'[^a-zA-Z]', '', word)
-            if clean_word:
-                total_syllables += count_syllables(clean_word)
+    words = ' '.join(sentences).split()
+    total_words = len(words)
 
     if total_words == 0:
         return "elementary"
 
+    total_syllables = _count_total_syllables(words)
+
     # Calculate averages
     avg_sentence_length = total_words / len(sentences)
     avg_syllables_per_word = total_syllables / total_words
@@ -275,6 +431,40 @@ def calculate_reading_level(text: str) -> str:
         return "professional"
 
 
+def _count_total_syllables(words: List[str]) -> int:
+    """
+    Sum count_syllables over the letters of each word, vectorized with NumPy
+
+    Same rules as count_syllables applied per word (non-letters dropped,
+    trailing e ignored, at least one syllable), but computed over one byte
+    array for the whole text instead of a Python loop per character.
+
+    Args:
+        words: Whitespace-separated words
+
+    Returns:
+        Total syllable count
+    """
+    # Keep only ASCII letters (non-ASCII is dropped before lowercasing)
+    arr = np.frombuffer(' '.join(words).encode('ascii', 'ignore').lower(), dtype=np.uint8)
+    arr = arr[_IS_LETTER[arr] | (arr == 32)]
+    if not arr.size:
+        return 0
+
+    is_letter = arr != 32
+    is_last = is_letter & np.append(arr[1:] == 32, True)
+
+    # Vowels that count, and the first vowel of each run (a syllable)
+    vowel = _IS_VOWEL[arr] & ~(is_last & (arr == ord('e')))
+    starts = vowel & ~np.concatenate(([False], vowel[:-1]))
+
+    word_ids = np.cumsum(~is_letter)
+    syllables = np.bincount(word_ids[starts], minlength=len(words))
+    has_letters = np.bincount(word_ids[is_letter], minlength=len(words)) > 0
+
+    return int(np.maximum(syllables, 1)[has_letters].sum())
+
+
 def get_word_difficulty(word: str) -> str:
     """
     Estimate word difficulty
@@ -308,23 +498,39 @@ def split_into_chunks(text: str, max_chars: int = 500, overlap: int = 50) -> Lis
     Returns:
         List of text chunks
     """
+    return list(iter_chunks(text, max_chars, overlap))
+
+
+def iter_chunks(text: str, max_chars: int = 500, overlap: int = 50) -> Iterator[str]:
+    """
+    Lazily split text into chunks (see split_into_chunks)
+
+    Args:
+        text: Text to split
+        max_chars: Maximum characters per chunk
+        overlap: Number of overlapping characters between chunks
+
+    Yields:
+        Text chunks
+    """
     if len(text) <= max_chars:
-        return [text]
+        yield text
+        return
 
-    chunks = []
+    # Every sentence end ('. '), found in one scan up front
+    boundaries = [match.start() for match in re.finditer(r'\. ', text)]
     start = 0
 
     while start < len(text):
         end = start + max_chars
 
-        # Try to break at sentence boundary
+        # Try to break at the first sentence end within 100 chars of the
+        # limit; only ends past start, or a small max_chars never advances
         if end < len(text):
-            # Look for sentence end
-            next_period = text.find('. ', end - 100, end + 100)
-            if next_period != -1:
-                end = next_period + 2
-
-        chunks.append(text[start:end])
-        start = end - overlap
+            idx = bisect.bisect_left(boundaries, max(end - 100, start + 1))
+            if idx < len(boundaries) and boundaries[idx] + 2 <= end + 100:
+                end = boundaries[idx] + 2
 
-    return chunks
\ No newline at end of file
+        yield text[start:end]
+        # Always advance, even when end snapped to a boundary near start
+        start = max(end - overlap, start + 1)
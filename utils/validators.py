@@ -2,9 +2,90 @@
 Input validation utilities
 """
 import re
-from typing import Optional
+import threading
+from functools import lru_cache
+from html import unescape
+from typing import Iterable, List, Optional
 import uuid
 
+# Try to import hyperscan (SIMD multi-pattern matching, x86-64 only) and
+# pyahocorasick for a backtracking-free suspicious-content scan
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Patterns compiled once at import. The email and URL patterns are used
+# with fullmatch (so a trailing newline doesn't slip through), and their
+# possessive quantifiers (*+, ++) stop the engine from backtracking through
+# runs that can never be given back usefully.
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]++@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}+')
+_URL_RE = re.compile(r'https?://[^\s/$.?#].[^\s]*+', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-\.]')
+_PATH_SEPARATORS_TO_UNDERSCORE = str.maketrans({'/': '_', '\\': '_'})
+_MAX_FILENAME_LENGTH = 255
+_EMPTY_FILENAME = 'unnamed_file'
+
+# Script/handler markers rejected in user input, matched in one scan
+_SUSPICIOUS_MARKERS = ('<script', 'javascript:', 'onerror=', 'onclick=', '<iframe')
+_SUSPICIOUS_RE = re.compile('|'.join(map(re.escape, _SUSPICIOUS_MARKERS)), re.IGNORECASE)
+
+_SUSPICIOUS_DATABASE = None
+if HYPERSCAN_AVAILABLE:
+    _SUSPICIOUS_DATABASE = hyperscan.Database()
+    _SUSPICIOUS_DATABASE.compile(
+        expressions=[re.escape(marker).encode() for marker in _SUSPICIOUS_MARKERS],
+        ids=list(range(len(_SUSPICIOUS_MARKERS))),
+        elements=len(_SUSPICIOUS_MARKERS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_SUSPICIOUS_MARKERS)
+    )
+
+# A hyperscan scratch can serve one scan at a time, so each thread
+# (FastAPI's threadpool, test workers) gets its own
+_SCAN_STATE = threading.local()
+
+_SUSPICIOUS_AUTOMATON = None
+if AHOCORASICK_AVAILABLE and _SUSPICIOUS_DATABASE is None:
+    _SUSPICIOUS_AUTOMATON = ahocorasick.Automaton()
+    for _marker in _SUSPICIOUS_MARKERS:
+        _SUSPICIOUS_AUTOMATON.add_word(_marker, _marker)
+    _SUSPICIOUS_AUTOMATON.make_automaton()
+
+# Phone formatting characters (whitespace, as matched by \s, plus "-().")
+# deleted in one str.translate pass. Every whitespace code point is <= U+3000.
+_PHONE_STRIP_TABLE = str.maketrans('', '', '-().' + ''.join(
+    char for char in map(chr, range(0x3001)) if char.isspace()
+))
+
+# NPCs a session can talk to
+_VALID_NPC_IDS = frozenset(('chro', 'ceo', 'regional_manager'))
+_INVALID_NPC_ERROR = "Invalid NPC ID. Must be one of: chro, ceo, regional_manager"
+
+# Canonical UUID text with every hex digit mapped to "0"
+_HEX_TO_ZERO = str.maketrans("0123456789abcdefABCDEF", "0" * 22)
+_UUID_TEMPLATE = "00000000-0000-0000-0000-000000000000"
+
+# Results kept for recently seen emails / session IDs. The same values come
+# back on every request of a session, and the bound keeps a flood of
+# distinct junk input from growing the cache.
+VALIDATION_CACHE_SIZE = 4096
+
+# Longest email address (RFC 5321 path limit) and session ID
+# ("urn:uuid:" + canonical UUID) that can be valid; anything longer is
+# rejected before reaching the caches
+MAX_EMAIL_LENGTH = 254
+MAX_SESSION_ID_LENGTH = 45
+
 
 def validate_email(email: str) -> bool:
     """
@@ -16,8 +97,32 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Only short strings are cached, so oversized input can't fill memory
+    if isinstance(email, str) and len(email) > MAX_EMAIL_LENGTH:
+        return False
+    return _validate_email(email)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_email(email: str) -> bool:
+    """validate_email for input of at most MAX_EMAIL_LENGTH (cached)"""
+    return _EMAIL_RE.fullmatch(email) is not None
+
+
+def validate_emails(emails: Iterable[str]) -> List[bool]:
+    """
+    Validate many email addresses (e.g. a bulk user import)
+
+    Same rules as validate_email, but the pattern is mapped over the input
+    in C instead of paying a Python call per address.
+
+    Args:
+        emails: Email addresses to validate
+
+    Returns:
+        One True/False per address, in input order
+    """
+    return [match is not None for match in map(_EMAIL_RE.fullmatch, emails)]
 
 
 def validate_session_id(session_id: str) -> bool:
@@ -30,6 +135,27 @@ def validate_session_id(session_id: str) -> bool:
     Returns:
         True if valid UUID format, False otherwise
     """
+    # Only strings are cached (anything else may be unhashable), and only
+    # short ones, so oversized input can't fill memory
+    if isinstance(session_id, str):
+        if len(session_id) > MAX_SESSION_ID_LENGTH:
+            return False
+        return _validate_session_id_str(session_id)
+    return _parse_uuid(session_id)
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+def _validate_session_id_str(session_id: str) -> bool:
+    """validate_session_id for str input (cached)"""
+    # Fast path: canonical 8-4-4-4-12 form, checked in one C-level pass
+    if len(session_id) == 36 and session_id.translate(_HEX_TO_ZERO) == _UUID_TEMPLATE:
+        return True
+    return _parse_uuid(session_id)
+
+
+def _parse_uuid(session_id) -> bool:
+    """Whether uuid.UUID accepts session_id"""
+    # Other spellings uuid.UUID accepts (braces, urn:uuid:, no hyphens)
     try:
         uuid.UUID(session_id)
         return True
@@ -59,21 +185,52 @@ def validate_user_input(text: str, max_length: int = 2000, min_length: int = 1)
         return False, f"Input must be at most {max_length} characters"
 
     # Check for suspicious patterns
-    suspicious_patterns = [
-        r'<script',
-        r'javascript:',
-        r'onerror=',
-        r'onclick=',
-        r'<iframe',
-    ]
-
-    for pattern in suspicious_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return False, "Input contains potentially malicious content"
+    if _contains_suspicious(text):
+        return False, "Input contains potentially malicious content"
 
     return True, None
 
 
+def _stop_scan(pattern_id, start, end, flags, context) -> bool:
+    """Hyperscan match handler: returning True terminates the scan"""
+    return True
+
+
+def _get_scratch():
+    """This thread's hyperscan scratch space, allocated on first use"""
+    scratch = getattr(_SCAN_STATE, "scratch", None)
+    if scratch is None:
+        scratch = _SCAN_STATE.scratch = hyperscan.Scratch(_SUSPICIOUS_DATABASE)
+    return scratch
+
+
+def _contains_suspicious(text: str) -> bool:
+    """Whether text contains any suspicious marker (case-insensitive)"""
+    if _SUSPICIOUS_DATABASE is not None:
+        # casefold() first: hyperscan's caseless mode only folds ASCII.
+        # surrogatepass keeps lone surrogates (valid in JSON strings)
+        # from failing the encode. The handler halts the scan at the
+        # first match.
+        try:
+            _SUSPICIOUS_DATABASE.scan(
+                text.casefold().encode(errors="surrogatepass"),
+                match_event_handler=_stop_scan,
+                scratch=_get_scratch()
+            )
+        except hyperscan.ScanTerminated:
+            return True
+        except hyperscan.error:
+            # Any other scan failure: fall through to the regex
+            return _SUSPICIOUS_RE.search(text) is not None
+        return False
+
+    if _SUSPICIOUS_AUTOMATON is not None:
+        # casefold() also folds characters like U+017F that re.IGNORECASE
+        # treats as ASCII letters
+        return next(_SUSPICIOUS_AUTOMATON.iter(text.casefold()), None) is not None
+    return _SUSPICIOUS_RE.search(text) is not None
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename to prevent directory traversal
@@ -85,20 +242,24 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove path separators
-    filename = filename.replace('/', '_').replace('\\', '_')
+    filename = filename.translate(_PATH_SEPARATORS_TO_UNDERSCORE)
 
     # Remove any dots at the start (hidden files)
     filename = filename.lstrip('.')
 
     # Remove special characters except dash, underscore, and dot
-    filename = re.sub(r'[^\w\-\.]', '_', filename)
+    filename = _FILENAME_SANITIZE_RE.sub('_', filename)
 
-    # Limit length
-    if len(filename) > 255:
-        name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-        filename = name[:250] + ('.' + ext if ext else '')
+    # Common case: already short enough
+    length = len(filename)
+    if length == 0:
+        return _EMPTY_FILENAME
+    if length <= _MAX_FILENAME_LENGTH:
+        return filename
 
-    return filename or 'unnamed_file'
+    # Limit length
+    name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
+    return name[:250] + ('.' + ext if ext else '')
 
 
 def validate_age(age: int) -> tuple[bool, Optional[str]]:
@@ -111,7 +272,9 @@ def validate_age(age: int) -> tuple[bool, Optional[str]]:
     Returns:
         (is_valid, error_message)
     """
-    if not isinstance(age, int):
+    # type() rather than isinstance(): bool is an int subclass, but True
+    # is not an age (same check in the validators below)
+    if type(age) is not int:
         return False, "Age must be an integer"
 
     if age < 8:
@@ -133,10 +296,9 @@ def validate_npc_id(npc_id: str) -> tuple[bool, Optional[str]]:
     Returns:
         (is_valid, error_message)
     """
-    valid_npcs = ['chro', 'ceo', 'regional_manager']
-
-    if npc_id not in valid_npcs:
-        return False, f"Invalid NPC ID. Must be one of: {', '.join(valid_npcs)}"
+    # isinstance first: unhashable input would make the set lookup raise
+    if not isinstance(npc_id, str) or npc_id not in _VALID_NPC_IDS:
+        return False, _INVALID_NPC_ERROR
 
     return True, None
 
@@ -151,7 +313,7 @@ def validate_relationship_score(score: int) -> tuple[bool, Optional[str]]:
     Returns:
         (is_valid, error_message)
     """
-    if not isinstance(score, int):
+    if type(score) is not int:
         return False, "Score must be an integer"
 
     if score < -10 or score > 10:
@@ -170,7 +332,7 @@ def validate_module_number(module: int) -> tuple[bool, Optional[str]]:
     Returns:
         (is_valid, error_message)
     """
-    if not isinstance(module, int):
+    if type(module) is not int:
         return False, "Module must be an integer"
 
     if module < 1 or module > 3:
@@ -189,22 +351,14 @@ def sanitize_html(text: str) -> str:
     Returns:
         Text with HTML removed
     """
-    # Remove HTML tags
-    clean = re.sub(r'<[^>]+>', '', text)
-
-    # Decode HTML entities
-    html_entities = {
-        '&lt;': '<',
-        '&gt;': '>',
-        '&amp;': '&',
-        '&quot;': '"',
-        '&#39;': "'",
-    }
-
-    for entity, char in html_entities.items():
-        clean = clean.replace(entity, char)
+    # Remove HTML tags. No tag can end past the last '>', so the regex only
+    # scans up to it; otherwise every unclosed '<' (e.g. "<<<<...")
+    # rescans the rest of the text and the strip goes quadratic.
+    end = text.rfind('>') + 1
+    clean = _HTML_TAG_RE.sub('', text[:end]) + text[end:]
 
-    return clean
+    # Decode HTML entities (named and numeric, in one pass)
+    return unescape(clean)
 
 
 def validate_phone_number(phone: str) -> bool:
@@ -218,7 +372,7 @@ def validate_phone_number(phone: str) -> bool:
         True if valid format, False otherwise
     """
     # Remove common formatting characters
-    cleaned = re.sub(r'[\s\-\(\)\.]', '', phone)
+    cleaned = phone.translate(_PHONE_STRIP_TABLE)
 
     # Check if remaining characters are digits
     if not cleaned.isdigit():
@@ -238,8 +392,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url, re.IGNORECASE))
+    return _URL_RE.fullmatch(url) is not None
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str: